@@ -4,11 +4,16 @@ Database adapter - SWAP THIS AT WORK
 Currently uses mock DB for local development.
 To use work environment: Comment out LOCAL section, uncomment WORK section below.
 """
+import logging
+from backend.lib.singleton import LazySingleton
 
 # ==============================================================================
 # LOCAL IMPLEMENTATION (for development)
 # ==============================================================================
 
+_log = logging.getLogger(__name__)
+
+
 class DBManager:
     """
     Mock database manager for local development.
@@ -24,7 +29,7 @@ class DBManager:
             env: Environment (dev, uat, prod)
         """
         self.env = env
-        print(f"[LOCAL] DBManager initialized for {env} environment")
+        _log.debug("[LOCAL] DBManager initialized for %s environment", env)
 
     def query(self, sql, params=None):
         """
@@ -37,7 +42,7 @@ class DBManager:
         Returns:
             Mock result set
         """
-        print(f"[LOCAL] Mock query: {sql}")
+        _log.debug("[LOCAL] Mock query: %s", sql)
         return []
 
     def execute(self, sql, params=None):
@@ -51,16 +56,16 @@ class DBManager:
         Returns:
             Number of rows affected (mock)
         """
-        print(f"[LOCAL] Mock execute: {sql}")
+        _log.debug("[LOCAL] Mock execute: %s", sql)
         return 0
 
     def close(self):
         """Close connection (mock)."""
-        print(f"[LOCAL] DBManager closed")
+        _log.debug("[LOCAL] DBManager closed")
 
 
-# Singleton instance
-_db_manager = None
+# Shared instance, built on first use
+_db_manager = LazySingleton()
 
 
 def get_db_manager(env='dev'):
@@ -73,10 +78,7 @@ def get_db_manager(env='dev'):
     Returns:
         DBManager singleton
     """
-    global _db_manager
-    if _db_manager is None:
-        _db_manager = DBManager(env=env)
-    return _db_manager
+    return _db_manager.get(DBManager, env=env)
 
 
 # ==============================================================================
@@ -86,8 +88,8 @@ def get_db_manager(env='dev'):
 # # Import your work DB manager class
 # from your_work_package.db import DBManager
 #
-# # Singleton instance
-# _db_manager = None
+# # Shared instance, built on first use
+# _db_manager = LazySingleton()
 #
 # def get_db_manager(env='prod'):
 #     """
@@ -99,7 +101,4 @@ def get_db_manager(env='dev'):
 #     Returns:
 #         DBManager singleton
 #     """
-#     global _db_manager
-#     if _db_manager is None:
-#         _db_manager = DBManager(env=env)
-#     return _db_manager
+#     return _db_manager.get(DBManager, env=env)
@@ -4,11 +4,16 @@ Hydra adapter - SWAP THIS AT WORK
 Currently uses mock Hydra for local development.
 To use work environment: Comment out LOCAL section, uncomment WORK section below.
 """
+import logging
+from backend.lib.singleton import LazySingleton
 
 # ==============================================================================
 # LOCAL IMPLEMENTATION (for development)
 # ==============================================================================
 
+_log = logging.getLogger(__name__)
+
+
 class HydraManager:
     """
     Mock Hydra operations manager for local development.
@@ -24,7 +29,7 @@ class HydraManager:
             env: Environment (dev, uat, prod)
         """
         self.env = env
-        print(f"[LOCAL] HydraManager initialized for {env} environment")
+        _log.debug("[LOCAL] HydraManager initialized for %s environment", env)
 
     def get_config(self, config_name):
         """
@@ -36,7 +41,7 @@ class HydraManager:
         Returns:
             Mock configuration dict
         """
-        print(f"[LOCAL] Mock get_config: {config_name}")
+        _log.debug("[LOCAL] Mock get_config: %s", config_name)
         return {}
 
     def set_config(self, config_name, config_data):
@@ -50,7 +55,7 @@ class HydraManager:
         Returns:
             Success status (mock)
         """
-        print(f"[LOCAL] Mock set_config: {config_name}")
+        _log.debug("[LOCAL] Mock set_config: %s", config_name)
         return True
 
     def run_operation(self, operation_name, params=None):
@@ -64,12 +69,12 @@ class HydraManager:
         Returns:
             Mock operation result
         """
-        print(f"[LOCAL] Mock run_operation: {operation_name}")
+        _log.debug("[LOCAL] Mock run_operation: %s", operation_name)
         return {"status": "success", "data": {}}
 
 
-# Singleton instance
-_hydra_manager = None
+# Shared instance, built on first use
+_hydra_manager = LazySingleton()
 
 
 def get_hydra_manager(env='dev'):
@@ -82,10 +87,7 @@ def get_hydra_manager(env='dev'):
     Returns:
         HydraManager singleton
     """
-    global _hydra_manager
-    if _hydra_manager is None:
-        _hydra_manager = HydraManager(env=env)
-    return _hydra_manager
+    return _hydra_manager.get(HydraManager, env=env)
 
 
 # ==============================================================================
@@ -95,8 +97,8 @@ def get_hydra_manager(env='dev'):
 # # Import your work Hydra manager class
 # from your_work_package.hydra import HydraManager
 #
-# # Singleton instance
-# _hydra_manager = None
+# # Shared instance, built on first use
+# _hydra_manager = LazySingleton()
 #
 # def get_hydra_manager(env='prod'):
 #     """
@@ -108,7 +110,4 @@ def get_hydra_manager(env='dev'):
 #     Returns:
 #         HydraManager singleton
 #     """
-#     global _hydra_manager
-#     if _hydra_manager is None:
-#         _hydra_manager = HydraManager(env=env)
-#     return _hydra_manager
+#     return _hydra_manager.get(HydraManager, env=env)
@@ -10,31 +10,49 @@ from pathlib import Path
 # LOCAL IMPLEMENTATION (for development)
 # ==============================================================================
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import json
 import sys
-from datetime import datetime
+import time
 from typing import Dict, Any
 
+# orjson is optional; it serializes several times faster than the stdlib.
+# The fallback is configured to match orjson's compact UTF-8 output, so
+# log lines look the same whichever is installed.
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data).decode('utf-8')
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
 # Local configuration
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "json"  # json or text
-LOG_FILE = Path(__file__).parent.parent.parent / "logs" / "dashboard.log"
+LOG_FILE = None  # None means <project root>/logs/dashboard.log
+LOG_BUFFER_CAPACITY = 512  # Records held in memory before flushing to disk
 
+# Execution context fields rendered by the formatters
+CONTEXT_FIELDS = ('user', 'request_id', 'tool_path')
 
-class ContextFilter(logging.Filter):
-    """
-    Logging filter that adds execution context to log records.
+
+class ContextAdapter(logging.LoggerAdapter):
     """
-    def __init__(self, context):
-        super().__init__()
-        self.context = context
+    Logger adapter that adds execution context to log records.
 
-    def filter(self, record):
-        """Add context fields to the log record."""
-        for key, value in self.context.items():
-            setattr(record, key, value)
-        return True
+    Unlike a filter, the context lives on the adapter rather than on the
+    shared logger, so per-execution context never accumulates.
+    """
+    def process(self, msg, kwargs):
+        """Merge context fields with any call-site extra fields."""
+        extra = kwargs.get('extra')
+        kwargs['extra'] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
 
 
 class JSONFormatter(logging.Formatter):
@@ -42,22 +60,26 @@ class JSONFormatter(logging.Formatter):
     Format log records as JSON for structured logging.
     """
     def format(self, record):
+        # Use the record's own creation time (UTC), not the time of formatting
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created))
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': f"{timestamp}.{int(record.msecs):03d}Z",
             'level': record.levelname,
             'message': record.getMessage(),
         }
 
         # Add context fields if present
-        for attr in ['user', 'request_id', 'tool_path']:
-            if hasattr(record, attr):
-                log_data[attr] = getattr(record, attr)
+        fields = record.__dict__
+        for attr in CONTEXT_FIELDS:
+            value = fields.get(attr)
+            if value is not None:
+                log_data[attr] = value
 
         # Add exception info if present
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return _json_dumps(log_data)
 
 
 class TextFormatter(logging.Formatter):
@@ -65,48 +87,87 @@ class TextFormatter(logging.Formatter):
     Format log records as human-readable text.
     """
     def format(self, record):
-        context = []
-        for attr in ['user', 'request_id', 'tool_path']:
-            if hasattr(record, attr):
-                context.append(f"{attr}={getattr(record, attr)}")
+        fields = record.__dict__
+        context = [
+            f"{attr}={fields[attr]}"
+            for attr in CONTEXT_FIELDS
+            if fields.get(attr) is not None
+        ]
 
         context_str = f" [{' '.join(context)}]" if context else ""
 
         return f"{record.levelname}: {record.getMessage()}{context_str}"
 
 
+@functools.lru_cache(maxsize=None)
+def _log_file():
+    """
+    Resolve the log file path on first use.
+
+    Returns:
+        Path to the log file
+    """
+    if LOG_FILE:
+        return Path(LOG_FILE)
+    return Path(__file__).resolve().parents[2] / "logs" / "dashboard.log"
+
+
+# Resolved once from the configuration constants above
+_LOG_LEVEL_NUM = getattr(logging, LOG_LEVEL.upper())
+_FORMATTER_CLS = JSONFormatter if LOG_FORMAT.lower() == 'json' else TextFormatter
+
+# Shared by every handler; formatters hold no per-handler state
+_FORMATTER = _FORMATTER_CLS()
+
+# Set once configure_root_logger has attached its handlers
+_root_configured = False
+
+
 def configure_root_logger():
     """
     Configure the root logger for the application.
 
-    Called once during application startup.
+    Called once during application startup. Repeat calls are no-ops so
+    handlers are never stacked (which would duplicate every record).
     """
+    global _root_configured
+    if _root_configured:
+        return
+
     # Create logs directory if it doesn't exist
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    log_file = _log_file()
+    log_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, LOG_LEVEL.upper()))
+    root_logger.setLevel(_LOG_LEVEL_NUM)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
 
-    # File handler
-    file_handler = logging.FileHandler(LOG_FILE)
+    # File handler, buffered so records hit the disk in batches.
+    # ERROR and above flush immediately so crash context is never lost.
+    # JSON lines are raw UTF-8 (see _json_dumps), whatever the locale.
+    file_target = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_target
+    )
     file_handler.setLevel(logging.DEBUG)
+    atexit.register(file_handler.flush)
 
-    # Select formatter based on LOG_FORMAT
-    if LOG_FORMAT.lower() == 'json':
-        formatter = JSONFormatter()
-    else:
-        formatter = TextFormatter()
-
-    console_handler.setFormatter(formatter)
-    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
+    file_target.setFormatter(_FORMATTER)
 
     root_logger.addHandler(console_handler)
     root_logger.addHandler(file_handler)
+    _root_configured = True
+
+
+# Logger behind every context adapter handed out by get_logger
+_context_logger = logging.getLogger(__name__)
 
 
 def get_logger(
@@ -126,25 +187,11 @@ def get_logger(
         request_id: Unique identifier for this execution
 
     Returns:
-        Logger with context filter applied
+        Logger adapter with context applied
     """
-    logger = logging.getLogger(__name__)
-
-    # Build context dictionary
-    context = {}
-    if tool_path:
-        context['tool_path'] = tool_path
-    if user:
-        context['user'] = user
-    if request_id:
-        context['request_id'] = request_id
-
-    # Add context filter if we have context
-    if context:
-        context_filter = ContextFilter(context)
-        logger.addFilter(context_filter)
-
-    return logger
+    # Unset fields stay None; the formatters skip None values
+    context = {'tool_path': tool_path, 'user': user, 'request_id': request_id}
+    return ContextAdapter(_context_logger, context)
 
 
 # ==============================================================================
@@ -4,11 +4,16 @@ SFTP adapter - SWAP THIS AT WORK
 Currently uses mock SFTP for local development.
 To use work environment: Comment out LOCAL section, uncomment WORK section below.
 """
+import logging
+from backend.lib.singleton import LazySingleton
 
 # ==============================================================================
 # LOCAL IMPLEMENTATION (for development)
 # ==============================================================================
 
+_log = logging.getLogger(__name__)
+
+
 class SFTPManager:
     """
     Mock SFTP manager for local development.
@@ -27,7 +32,7 @@ class SFTPManager:
         """
         self.host = host
         self.username = username
-        print(f"[LOCAL] SFTPManager initialized for {host}")
+        _log.debug("[LOCAL] SFTPManager initialized for %s", host)
 
     def upload(self, local_path, remote_path):
         """
@@ -40,7 +45,7 @@ class SFTPManager:
         Returns:
             Success status (mock)
         """
-        print(f"[LOCAL] Mock upload: {local_path} -> {remote_path}")
+        _log.debug("[LOCAL] Mock upload: %s -> %s", local_path, remote_path)
         return True
 
     def download(self, remote_path, local_path):
@@ -54,7 +59,7 @@ class SFTPManager:
         Returns:
             Success status (mock)
         """
-        print(f"[LOCAL] Mock download: {remote_path} -> {local_path}")
+        _log.debug("[LOCAL] Mock download: %s -> %s", remote_path, local_path)
         return True
 
     def list_files(self, remote_dir):
@@ -67,16 +72,16 @@ class SFTPManager:
         Returns:
             List of file names (mock)
         """
-        print(f"[LOCAL] Mock list files: {remote_dir}")
+        _log.debug("[LOCAL] Mock list files: %s", remote_dir)
         return []
 
     def close(self):
         """Close SFTP connection (mock)."""
-        print(f"[LOCAL] SFTPManager closed")
+        _log.debug("[LOCAL] SFTPManager closed")
 
 
-# Singleton instance
-_sftp_manager = None
+# Shared instance, built on first use
+_sftp_manager = LazySingleton()
 
 
 def get_sftp_manager(host=None, username=None, key_file=None):
@@ -91,10 +96,7 @@ def get_sftp_manager(host=None, username=None, key_file=None):
     Returns:
         SFTPManager singleton
     """
-    global _sftp_manager
-    if _sftp_manager is None:
-        _sftp_manager = SFTPManager(host=host, username=username, key_file=key_file)
-    return _sftp_manager
+    return _sftp_manager.get(SFTPManager, host=host, username=username, key_file=key_file)
 
 
 # ==============================================================================
@@ -104,8 +106,8 @@ def get_sftp_manager(host=None, username=None, key_file=None):
 # # Import your work SFTP manager class
 # from your_work_package.sftp import SFTPManager
 #
-# # Singleton instance
-# _sftp_manager = None
+# # Shared instance, built on first use
+# _sftp_manager = LazySingleton()
 #
 # def get_sftp_manager(host=None, username=None, key_file=None):
 #     """
@@ -119,7 +121,4 @@ def get_sftp_manager(host=None, username=None, key_file=None):
 #     Returns:
 #         SFTPManager singleton
 #     """
-#     global _sftp_manager
-#     if _sftp_manager is None:
-#         _sftp_manager = SFTPManager(host=host, username=username, key_file=key_file)
-#     return _sftp_manager
+#     return _sftp_manager.get(SFTPManager, host=host, username=username, key_file=key_file)
@@ -24,14 +24,14 @@ class ExecutionContext:
         timestamp: When execution started
         tool_path: Full path of the tool (e.g., "RAD/ingestor/timeline")
         params: Input parameters provided by user
-        logger: Pre-configured logger with context
+        logger: Pre-configured logger adapter with context
     """
     request_id: str
     user: str
     timestamp: datetime
     tool_path: str
     params: Dict[str, Any]
-    logger: logging.Logger
+    logger: logging.LoggerAdapter
 
 
 class BaseTool(ABC):
@@ -45,11 +45,19 @@ class BaseTool(ABC):
         category: Tool category path (e.g., "RAD/ingestor")
         name: Tool name (e.g., "timeline")
         description: Human-readable description
+        full_path: "category/name", set when the subclass is defined
     """
 
     category = None
     name = None
     description = None
+    full_path = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Compute full_path once per tool class rather than per access."""
+        super().__init_subclass__(**kwargs)
+        if cls.category and cls.name:
+            cls.full_path = f"{cls.category}/{cls.name}"
 
     def __init__(self):
         """Initialize the tool."""
@@ -77,15 +85,5 @@ class BaseTool(ABC):
         """
         pass
 
-    @property
-    def full_path(self):
-        """
-        Get the full tool path.
-
-        Returns:
-            Full path string (e.g., "RAD/ingestor/timeline")
-        """
-        return f"{self.category}/{self.name}"
-
     def __repr__(self):
         return f"{self.__class__.__name__}(path='{self.full_path}')"
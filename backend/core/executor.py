@@ -8,13 +8,15 @@ Single entry point for all tool executions. Handles:
 - Error handling
 - Result wrapping
 """
+import time
 import uuid
 import traceback
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 from backend.core.registry import get_registry
 from backend.core.base_tool import ExecutionContext
 from backend.lib.result import Result
+from backend.lib.singleton import LazySingleton
 from backend.adapters.logger import get_logger
 from backend.lib.errors import (
     ToolExecutionError,
@@ -56,10 +58,10 @@ class ToolExecutor:
             Result object (success or error)
         """
         # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        request_id = uuid.uuid4().hex
 
         # Create context
-        timestamp = datetime.utcnow()
+        timestamp = datetime.now(timezone.utc)
         logger = get_logger(
             tool_path=tool_path,
             user=user,
@@ -75,32 +77,27 @@ class ToolExecutor:
             logger=logger
         )
 
-        # Log execution start
-        logger.info(
-            f"Tool execution started: {tool_path}",
-            extra={'params': params}
-        )
+        # Log execution start; parameters only at DEBUG
+        logger.info("Tool execution started: %s", tool_path)
+        logger.debug("Tool parameters: %s", params)
 
         try:
             # Get tool from registry
             tool = self.registry.get_tool(tool_path)
 
             # Execute tool
-            start_time = datetime.utcnow()
+            start_time = time.perf_counter()
             data = tool.run(context, **params)
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
             # Log success
-            logger.info(
-                f"Tool execution completed in {duration:.2f}s",
-                extra={'duration': duration}
-            )
+            logger.info("Tool execution completed in %.2fs", duration)
 
             return Result.success_result(data=data, request_id=request_id)
 
         except ToolNotFoundError as e:
             # Tool doesn't exist
-            logger.error(f"Tool not found: {e}")
+            logger.error("Tool not found: %s", e)
             return Result.error_result(
                 message=str(e),
                 request_id=request_id,
@@ -110,7 +107,7 @@ class ToolExecutor:
 
         except ToolExecutionError as e:
             # Expected business error
-            logger.warning(f"Tool execution failed: {e}")
+            logger.warning("Tool execution failed: %s", e)
             return Result.error_result(
                 message=str(e),
                 request_id=request_id,
@@ -122,7 +119,8 @@ class ToolExecutor:
             # Unexpected error
             tb = traceback.format_exc()
             logger.error(
-                f"Unexpected error during tool execution: {e}",
+                "Unexpected error during tool execution: %s",
+                e,
                 exc_info=True
             )
             return Result.error_result(
@@ -134,8 +132,8 @@ class ToolExecutor:
             )
 
 
-# Global singleton
-_executor = None
+# Shared instance, built on first use
+_executor = LazySingleton()
 
 
 def get_executor():
@@ -145,7 +143,4 @@ def get_executor():
     Returns:
         Singleton ToolExecutor instance
     """
-    global _executor
-    if _executor is None:
-        _executor = ToolExecutor()
-    return _executor
+    return _executor.get(ToolExecutor)
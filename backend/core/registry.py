@@ -1,33 +1,63 @@
 """
-Simple tool registry with explicit imports.
+Simple tool registry with explicit tool mapping.
 """
+import importlib
+from types import MappingProxyType
 from typing import Dict, Type
 from backend.core.base_tool import BaseTool
 from backend.lib.errors import ToolNotFoundError
+from backend.lib.singleton import LazySingleton
 
-# Direct imports of all tools
-from backend.tools.RAD.ingestor.timeline_tool import TimelineTool
-from backend.tools.RAD.ingestor.force_load_tool import ForceLoadTool
+
+def _freeze(node):
+    """
+    Make a read-only copy of a structure node.
+
+    Nested dictionaries become MappingProxyType views and '_tools' lists
+    become tuples, so no caller can change the shared structure.
+
+    Args:
+        node: Dictionary from Registry._build_structure
+
+    Returns:
+        MappingProxyType: Read-only copy of node
+    """
+    return MappingProxyType({
+        key: tuple(value) if key == '_tools' else _freeze(value)
+        for key, value in node.items()
+    })
 
 
 class Registry:
     """
     Simple tool registry with explicit tool mapping.
 
-    All tools are explicitly imported and registered in a dictionary.
+    All tools are explicitly registered in a dictionary as
+    "module:ClassName" references. A tool's module is only imported the
+    first time that tool is requested.
     """
 
     def __init__(self):
         """Initialize registry with explicit tool mapping."""
-        # Dictionary mapping tool paths to tool classes
+        # Dictionary mapping tool paths to tool class references
         # Paths use capitalized display names
-        self._tools: Dict[str, Type[BaseTool]] = {
-            'RAD/Ingestor/Timeline': TimelineTool,
-            'RAD/Ingestor/Force Load': ForceLoadTool,
+        self._tools: Dict[str, str] = {
+            'RAD/Ingestor/Timeline': 'backend.tools.RAD.ingestor.timeline_tool:TimelineTool',
+            'RAD/Ingestor/Force Load': 'backend.tools.RAD.ingestor.force_load_tool:ForceLoadTool',
         }
+        self._tool_paths = tuple(self._tools)
+
+        # The tool set is fixed, so the not-found hint is built once
+        self._available_tools = str(list(self._tool_paths))
 
-        # Build navigation structure from tool paths
-        self._structure = self._build_structure()
+        # Tool instances, created on first request and reused afterwards.
+        # Tools are stateless; per-execution state travels in the context.
+        self._instances: Dict[str, BaseTool] = {}
+
+        # Navigation structure is built on first use; execution never needs it
+        self._structure = None
+        self._categories = ()
+        self._tool_options: Dict[str, tuple] = {}  # Per category, on first request
 
     def _build_structure(self):
         """
@@ -44,20 +74,16 @@ class Registry:
         """
         structure = {}
 
-        for path in self._tools.keys():
-            parts = path.split('/')
+        for path in self._tools:
+            *categories, tool_name = path.split('/')
 
             # Navigate/create structure
             current = structure
-            for part in parts[:-1]:  # All but last (tool name)
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
+            for part in categories:
+                current = current.setdefault(part, {})
 
             # Add tool name to _tools list
-            if '_tools' not in current:
-                current['_tools'] = []
-            current['_tools'].append(parts[-1])
+            current.setdefault('_tools', []).append(tool_name)
 
         return structure
 
@@ -69,27 +95,53 @@ class Registry:
             path: Tool path (e.g., "RAD/ingestor/timeline")
 
         Returns:
-            Instantiated tool object
+            Shared tool instance
 
         Raises:
             ToolNotFoundError: If path doesn't exist
         """
+        tool = self._instances.get(path)
+        if tool is not None:
+            return tool
+
         if path not in self._tools:
             raise ToolNotFoundError(
                 f"Tool not found: {path}. "
-                f"Available tools: {list(self._tools.keys())}"
+                f"Available tools: {self._available_tools}"
             )
 
-        # Instantiate and return
-        return self._tools[path]()
+        # Import, instantiate once and cache. If two threads race here,
+        # setdefault makes both return whichever instance landed first.
+        tool = self._load_tool_class(path)()
+        return self._instances.setdefault(path, tool)
+
+    def _load_tool_class(self, path):
+        """
+        Import and return the tool class registered for a path.
+
+        Args:
+            path: Registered tool path
+
+        Returns:
+            Tool class
+        """
+        module_name, class_name = self._tools[path].split(':')
+        module = importlib.import_module(module_name)
+        tool_class: Type[BaseTool] = getattr(module, class_name)
+        return tool_class
 
     def get_structure(self):
         """
         Get the full hierarchical structure.
 
         Returns:
-            Nested dictionary of categories and tools
+            Read-only nested mapping of categories and tools, shared by
+            all callers; tool name lists are tuples
         """
+        if self._structure is None:
+            structure = self._build_structure()
+            self._categories = tuple(structure)
+            self._structure = _freeze(structure)
         return self._structure
 
     def get_categories(self):
@@ -97,22 +149,69 @@ class Registry:
         Get top-level categories.
 
         Returns:
-            List of category names (e.g., ["RAD", "DD"])
+            Tuple of category names (e.g., ("RAD", "DD"))
+        """
+        if self._structure is None:
+            self.get_structure()
+        return self._categories
+
+    def get_tool_options(self, category):
+        """
+        Get the tools under a category as (label, full_path) pairs.
+
+        Flattened from the structure on first request and reused after.
+
+        Args:
+            category: Top-level category name (e.g., "RAD")
+
+        Returns:
+            Tuple of (label, full_path) pairs in structure order, labels
+            joining the subcategory path (e.g., "Ingestor / Timeline")
+        """
+        options = self._tool_options.get(category)
+        if options is None:
+            collected = []
+            self._collect_tool_options(
+                self.get_structure()[category], category, (), collected
+            )
+            options = self._tool_options.setdefault(category, tuple(collected))
+        return options
+
+    def _collect_tool_options(self, subcategories, prefix, labels, options):
+        """
+        Recursively add (label, full_path) pairs for a subtree.
+
+        Args:
+            subcategories: Mapping of subcategories and '_tools'
+            prefix: Path prefix (e.g., "RAD")
+            labels: Subcategory names above this subtree
+            options: List to append pairs to
         """
-        return list(self._structure.keys())
+        for key, value in subcategories.items():
+            if key == '_tools':
+                # This is the list of tool names
+                for tool_name in value:
+                    options.append(
+                        (' / '.join(labels + (tool_name,)), f"{prefix}/{tool_name}")
+                    )
+            else:
+                # Recursively process this subcategory
+                self._collect_tool_options(
+                    value, f"{prefix}/{key}", labels + (key,), options
+                )
 
     def list_all_tools(self):
         """
         Get list of all tool paths.
 
         Returns:
-            List of tool paths
+            Tuple of tool paths
         """
-        return list(self._tools.keys())
+        return self._tool_paths
 
 
-# Global singleton
-_registry = None
+# Shared instance, built on first use
+_registry = LazySingleton()
 
 
 def get_registry():
@@ -122,7 +221,4 @@ def get_registry():
     Returns:
         Singleton Registry instance
     """
-    global _registry
-    if _registry is None:
-        _registry = Registry()
-    return _registry
+    return _registry.get(Registry)
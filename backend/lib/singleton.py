@@ -0,0 +1,38 @@
+"""
+Lazily created shared instances.
+"""
+import threading
+
+
+class LazySingleton:
+    """
+    Holder for an instance that is built on first use and then shared.
+
+    Creation happens under a lock, so concurrent first calls construct
+    (and for adapters, connect) only once. Later calls skip the lock.
+    """
+
+    def __init__(self):
+        """Initialize an empty holder."""
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def get(self, factory, *args, **kwargs):
+        """
+        Get the shared instance, creating it on the first call.
+
+        Args:
+            factory: Callable that builds the instance
+            *args: Positional arguments for factory (first call only)
+            **kwargs: Keyword arguments for factory (first call only)
+
+        Returns:
+            The shared instance
+        """
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = factory(*args, **kwargs)
+                instance = self._instance
+        return instance
@@ -1,10 +1,12 @@
 """
 User identification for logging and audit trails.
 """
+import functools
 import os
 import getpass
 
 
+@functools.lru_cache(maxsize=1)
 def get_current_user():
     """
     Get current user identifier.
@@ -15,6 +17,9 @@ def get_current_user():
     3. getpass.getuser() (cross-platform)
     4. "unknown" (fallback)
 
+    The identity is constant for the process, so the result is cached.
+    Call get_current_user.cache_clear() to pick up environment changes.
+
     Returns:
         User identifier string
     """
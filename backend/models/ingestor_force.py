@@ -4,7 +4,10 @@ Force load model.
 Handles force load configuration and execution.
 """
 from typing import List, Dict, Any
+import numpy as np
+import pandas as pd
 from backend.lib.errors import ParameterValidationError, BusinessLogicError
+from backend.lib.singleton import LazySingleton
 
 # ==============================================================================
 # FORCE LOAD CONFIGURATION
@@ -28,11 +31,31 @@ FORCE_LOAD_TABLES = {
     },
 }
 
+# Columns every configuration row must provide
+REQUIRED_CONFIG_KEYS = ('configName', 'key', 'group')
+_REQUIRED_CONFIG_KEY_SET = frozenset(REQUIRED_CONFIG_KEYS)
+
+# Reference date for mock load results
+MOCK_BASE_DATE = np.datetime64('2025-01-15')
+
 # ==============================================================================
 # MODEL IMPLEMENTATION
 # ==============================================================================
 
 
+def _format_timestamps(days):
+    """
+    Format day-resolution datetime64 values as midnight timestamps.
+
+    Args:
+        days: numpy datetime64[D] array
+
+    Returns:
+        List of 'YYYY-MM-DD 00:00:00' strings
+    """
+    return np.char.add(np.datetime_as_string(days), ' 00:00:00').tolist()
+
+
 class IngestorForceModel:
     """
     Model for force load operations.
@@ -41,6 +64,9 @@ class IngestorForceModel:
     - Validating table configurations
     - Processing force load requests
     - Returning success/error states
+
+    The model holds no per-request state, so a single shared instance
+    (see get_force_model) is safe to use from concurrent executions.
     """
 
     def __init__(self):
@@ -55,19 +81,14 @@ class IngestorForceModel:
             table_name: Name of predefined table
 
         Returns:
-            List of configuration dictionaries with column data
+            List of configuration dictionaries with column data. Rows are
+            copies, so callers may edit them without touching the defaults.
 
         Raises:
             ParameterValidationError: If table name not found
         """
-        if table_name not in FORCE_LOAD_TABLES:
-            raise ParameterValidationError(
-                f"Table '{table_name}' not found in configuration",
-                user_message=f"Unknown table: {table_name}"
-            )
-
-        table_config = FORCE_LOAD_TABLES[table_name]
-        return table_config['data']
+        table_config = self.get_table_schema(table_name)
+        return [dict(row) for row in table_config['data']]
 
     def get_table_schema(self, table_name):
         """
@@ -82,13 +103,14 @@ class IngestorForceModel:
         Raises:
             ParameterValidationError: If table name not found
         """
-        if table_name not in FORCE_LOAD_TABLES:
+        table_config = FORCE_LOAD_TABLES.get(table_name)
+        if table_config is None:
             raise ParameterValidationError(
                 f"Table '{table_name}' not found in configuration",
                 user_message=f"Unknown table: {table_name}"
             )
 
-        return FORCE_LOAD_TABLES[table_name]
+        return table_config
 
     def validate_config(self, config_data):
         """
@@ -106,22 +128,21 @@ class IngestorForceModel:
                 user_message="Please provide at least one configuration row"
             )
 
-        for i, row in enumerate(config_data):
-            # Check required keys
-            required_keys = ['configName', 'key', 'group']
-            missing_keys = [k for k in required_keys if k not in row]
+        num_required = len(REQUIRED_CONFIG_KEYS)
 
-            if missing_keys:
+        for i, row in enumerate(config_data):
+            # Check required keys (list the missing ones only on failure)
+            if not row.keys() >= _REQUIRED_CONFIG_KEY_SET:
+                missing_keys = [k for k in REQUIRED_CONFIG_KEYS if k not in row]
                 raise ParameterValidationError(
                     f"Row {i} missing required keys: {missing_keys}",
                     user_message=f"Row {i+1} is missing required fields"
                 )
 
-            # Check for empty values (skip empty rows)
-            all_empty = all(not row.get(k) for k in required_keys)
-            some_empty = any(not row.get(k) for k in required_keys)
+            # Rows must be fully filled or fully empty (empty rows are skipped)
+            filled = sum(1 for k in REQUIRED_CONFIG_KEYS if row[k])
 
-            if some_empty and not all_empty:
+            if 0 < filled < num_required:
                 raise ParameterValidationError(
                     f"Row {i} has incomplete data",
                     user_message=f"Row {i+1} must have all fields filled or be empty"
@@ -146,43 +167,39 @@ class IngestorForceModel:
                 - success: True/False
                 - message: Result message
                 - rows_processed: Number of rows processed
-                - records: List of result records with DataFrame columns
+                - table_name: Table that was loaded
+                - dataframe: DataFrame of result records
 
         Raises:
             BusinessLogicError: If force load fails
         """
-        from datetime import datetime, timedelta
-        import random
-
         # Filter out empty rows
         valid_rows = [
             row for row in config_data
-            if any(row.get(k) for k in ['configName', 'key', 'group'])
+            if any(row.get(k) for k in REQUIRED_CONFIG_KEYS)
         ]
 
-        # Generate mock data with all required columns
-        records = []
-        base_date = datetime(2025, 1, 15)
-
-        for i, row in enumerate(valid_rows):
-            # Mock timestamps and IDs
-            last_loaded_ts = (base_date - timedelta(days=random.randint(1, 30))).strftime('%Y-%m-%d %H:%M:%S')
-            process_ts = (base_date - timedelta(days=random.randint(0, 5))).strftime('%Y-%m-%d %H:%M:%S')
-            cob = (base_date - timedelta(days=random.randint(0, 3))).strftime('%Y-%m-%d')
-            load_id = f"LD{random.randint(10000, 99999)}"
-            data_source_windows = f"Window_{random.randint(1, 5)}"
-
-            record = {
-                'configName': row.get('configName', ''),
-                'key': row.get('key', ''),
-                'group': row.get('group', ''),
-                'LastLoadedTS': last_loaded_ts,
-                'ProcessTS': process_ts,
-                'COB': cob,
-                'LoadID': load_id,
-                'DataSourceWindows': data_source_windows
-            }
-            records.append(record)
+        # Generate mock timestamps and IDs for all rows at once
+        n = len(valid_rows)
+        rng = np.random.default_rng()
+
+        # Subtracting integers from a datetime64[D] steps back whole days
+        last_loaded_ts = _format_timestamps(MOCK_BASE_DATE - rng.integers(1, 31, n))
+        process_ts = _format_timestamps(MOCK_BASE_DATE - rng.integers(0, 6, n))
+        cob = np.datetime_as_string(MOCK_BASE_DATE - rng.integers(0, 4, n)).tolist()
+        load_ids = np.char.add('LD', rng.integers(10000, 100000, n).astype(str)).tolist()
+        data_source_windows = np.char.add('Window_', rng.integers(1, 6, n).astype(str)).tolist()
+
+        # Assemble result columns; a missing config value becomes ''
+        df = pd.DataFrame.from_records(
+            [tuple(row.get(k, '') for k in REQUIRED_CONFIG_KEYS) for row in valid_rows],
+            columns=REQUIRED_CONFIG_KEYS
+        )
+        df['LastLoadedTS'] = last_loaded_ts
+        df['ProcessTS'] = process_ts
+        df['COB'] = cob
+        df['LoadID'] = load_ids
+        df['DataSourceWindows'] = data_source_windows
 
         mode = "dry run" if dry_run else "force load"
         return {
@@ -190,5 +207,19 @@ class IngestorForceModel:
             'message': f'Successfully completed {mode} for {len(valid_rows)} configurations to {table_name}',
             'rows_processed': len(valid_rows),
             'table_name': table_name,
-            'records': records
+            'dataframe': df
         }
+
+
+# Shared instance, built on first use
+_force_model = LazySingleton()
+
+
+def get_force_model():
+    """
+    Get the global IngestorForceModel instance.
+
+    Returns:
+        Singleton IngestorForceModel instance
+    """
+    return _force_model.get(IngestorForceModel)
@@ -3,6 +3,9 @@ Timeline data model.
 
 Handles querying and processing of ingestor timeline data.
 """
+import threading
+import time
+from collections import OrderedDict
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Any
@@ -14,6 +17,33 @@ from backend.lib.errors import DataAccessError
 
 TIMELINE_DESKS = ["Options", "Exotics", "Inflation", "LDFX", "FXG"]
 
+# Set form of TIMELINE_DESKS for membership checks (the list keeps UI order)
+TIMELINE_DESK_SET = frozenset(TIMELINE_DESKS)
+
+# Query results are cached per (desk, date): entries expire after
+# TIMELINE_CACHE_TTL seconds and the least recently used entry is dropped
+# once TIMELINE_CACHE_SIZE is reached. COB D is normally ingested on D+1,
+# so today and yesterday keep the short TTL; older COBs change rarely and
+# use TIMELINE_PAST_CACHE_TTL. Force loads can still change any COB, and
+# the cache is per process (one kernel per Voila session), so every entry
+# expires: ForceLoadTool's clear_timeline_cache only covers its own session.
+TIMELINE_CACHE_TTL = 300
+TIMELINE_PAST_CACHE_TTL = 3600
+TIMELINE_CACHE_SIZE = 256
+
+# ==============================================================================
+# QUERY CACHE
+# ==============================================================================
+
+_timeline_cache = OrderedDict()
+_timeline_cache_lock = threading.Lock()
+
+
+def clear_timeline_cache():
+    """Drop all cached timeline query results."""
+    with _timeline_cache_lock:
+        _timeline_cache.clear()
+
 # ==============================================================================
 # MODEL IMPLEMENTATION
 # ==============================================================================
@@ -50,12 +80,38 @@ class IngestorTimelineModel:
         Returns:
             DataFrame with columns: TS, COB, data, overwrite
 
+        Results are served from the query cache while fresh; results for
+        dates before yesterday stay fresh longer. Each call gets its own
+        shallow copy of the cached DataFrame.
+
         Raises:
             DataAccessError: If query fails
         """
+        key = (desk, date)
+        now = time.monotonic()
+
+        with _timeline_cache_lock:
+            entry = _timeline_cache.get(key)
+            if entry is not None and entry[0] > now:
+                _timeline_cache.move_to_end(key)
+                return entry[1].copy(deep=False)
+
         # TODO: Replace with actual database query
         # For now, return mock data
-        return self._get_mock_data(desk, date)
+        df = self._get_mock_data(desk, date)
+
+        if date.date() < datetime.now().date() - timedelta(days=1):
+            expires = now + TIMELINE_PAST_CACHE_TTL
+        else:
+            expires = now + TIMELINE_CACHE_TTL
+
+        with _timeline_cache_lock:
+            _timeline_cache[key] = (expires, df)
+            _timeline_cache.move_to_end(key)
+            while len(_timeline_cache) > TIMELINE_CACHE_SIZE:
+                _timeline_cache.popitem(last=False)
+
+        return df.copy(deep=False)
 
     def _get_mock_data(self, desk, date):
         """
@@ -98,14 +154,9 @@ class IngestorTimelineModel:
 
         Returns:
             Dictionary with:
-                - records: List of record dictionaries
                 - summary: Summary statistics
-                - metadata: Query metadata
                 - dataframe: Original DataFrame for UI rendering
         """
-        # Convert DataFrame to records
-        records = df.to_dict('records')
-
         # Calculate summary statistics
         summary = {
             'total_records': len(df),
@@ -117,7 +168,6 @@ class IngestorTimelineModel:
         }
 
         return {
-            'records': records,
             'summary': summary,
             'dataframe': df  # Include for UI rendering
         }
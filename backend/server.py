@@ -3,10 +3,16 @@ Backend initialization and bootstrap.
 
 Called once during application startup.
 """
+import logging
 from backend.adapters.logger import configure_root_logger
 from backend.core.registry import get_registry
 from backend.core.executor import get_executor
 
+logger = logging.getLogger(__name__)
+
+# Set once initialize_backend has run
+_initialized = False
+
 
 def initialize_backend():
     """
@@ -16,15 +22,22 @@ def initialize_backend():
     1. Configure logging
     2. Initialize registry
     3. Initialize executor
+
+    Repeat calls (e.g. re-creating the app in the same kernel) are no-ops.
     """
+    global _initialized
+    if _initialized:
+        return
+
     # Configure logging
     configure_root_logger()
 
     # Initialize registry
     registry = get_registry()
-    print(f"Registered {len(registry.list_all_tools())} tools")
+    logger.info("Registered %d tools", len(registry.list_all_tools()))
 
     # Initialize executor
     executor = get_executor()
 
-    print("Backend initialization complete")
+    logger.info("Backend initialization complete")
+    _initialized = True
@@ -5,9 +5,14 @@ Allows users to force load configuration data to predefined tables.
 """
 from typing import List, Dict, Any
 from backend.core.base_tool import BaseTool, ExecutionContext
-from backend.models.ingestor_force import IngestorForceModel, FORCE_LOAD_TABLES
+from backend.models.ingestor_force import get_force_model, FORCE_LOAD_TABLES
+from backend.models.ingestor_timeline import clear_timeline_cache
 from backend.lib.errors import ParameterValidationError
 
+# Valid table names as shown in the invalid-table error
+_AVAILABLE_TABLES = list(FORCE_LOAD_TABLES)
+_AVAILABLE_TABLES_TEXT = ', '.join(_AVAILABLE_TABLES)
+
 
 class ForceLoadTool(BaseTool):
     """
@@ -51,21 +56,23 @@ class ForceLoadTool(BaseTool):
             ParameterValidationError: If parameters are invalid
         """
         # Validate table name
-        context.logger.info(f"Validating parameters: table={table_name}, action={action}, dry_run={dry_run}")
+        context.logger.info(
+            "Validating parameters: table=%s, action=%s, dry_run=%s",
+            table_name, action, dry_run
+        )
 
         if table_name not in FORCE_LOAD_TABLES:
-            available_tables = list(FORCE_LOAD_TABLES.keys())
             raise ParameterValidationError(
-                f"Invalid table '{table_name}'. Must be one of: {available_tables}",
-                user_message=f"Please select a valid table: {', '.join(available_tables)}"
+                f"Invalid table '{table_name}'. Must be one of: {_AVAILABLE_TABLES}",
+                user_message=f"Please select a valid table: {_AVAILABLE_TABLES_TEXT}"
             )
 
-        # Create model
-        model = IngestorForceModel()
+        # Shared model instance
+        model = get_force_model()
 
         # Handle different actions
         if action == 'get_default':
-            context.logger.info(f"Getting default config for {table_name}")
+            context.logger.info("Getting default config for %s", table_name)
             default_config = model.get_default_config(table_name)
             schema = model.get_table_schema(table_name)
             return {
@@ -82,19 +89,23 @@ class ForceLoadTool(BaseTool):
                 )
 
             # Validate configuration data
-            context.logger.info(f"Validating {len(config)} configuration rows")
+            context.logger.info("Validating %d configuration rows", len(config))
             model.validate_config(config)
 
             context.logger.info("Configuration validated successfully")
 
             # Execute force load (with dry run support)
             mode = "dry run" if dry_run else "force load"
-            context.logger.info(f"Executing {mode} to {table_name}")
+            context.logger.info("Executing %s to %s", mode, table_name)
             result = model.execute_force_load(table_name, config, dry_run=dry_run)
 
+            # Loaded data can change any COB, including closed ones
+            if not dry_run:
+                clear_timeline_cache()
+
             context.logger.info(
-                f"{mode.capitalize()} complete: {result['rows_processed']} rows processed",
-                extra={'result': result}
+                "%s complete: %d rows processed",
+                mode.capitalize(), result['rows_processed']
             )
 
             return result
@@ -108,18 +119,18 @@ class ForceLoadTool(BaseTool):
                 )
 
             # Validate configuration data
-            context.logger.info(f"Validating {len(config)} configuration rows")
+            context.logger.info("Validating %d configuration rows", len(config))
             model.validate_config(config)
 
             context.logger.info("Configuration validated successfully")
 
             # Execute force load
-            context.logger.info(f"Executing force load to {table_name}")
+            context.logger.info("Executing force load to %s", table_name)
             result = model.execute_force_load(table_name, config, dry_run=False)
+            clear_timeline_cache()
 
             context.logger.info(
-                f"Force load complete: {result['rows_processed']} rows processed",
-                extra={'result': result}
+                "Force load complete: %d rows processed", result['rows_processed']
             )
 
             return result
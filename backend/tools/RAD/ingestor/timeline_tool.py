@@ -5,9 +5,12 @@ Allows users to query ingestor timeline data by desk and date.
 """
 from datetime import datetime
 from backend.core.base_tool import BaseTool, ExecutionContext
-from backend.models.ingestor_timeline import IngestorTimelineModel, TIMELINE_DESKS
+from backend.models.ingestor_timeline import IngestorTimelineModel, TIMELINE_DESKS, TIMELINE_DESK_SET
 from backend.lib.errors import ParameterValidationError
 
+# Valid desks as shown in the invalid-desk error
+_AVAILABLE_DESKS_TEXT = ', '.join(TIMELINE_DESKS)
+
 
 class TimelineTool(BaseTool):
     """
@@ -35,23 +38,28 @@ class TimelineTool(BaseTool):
             date: Date string (YYYY-MM-DD)
 
         Returns:
-            Dictionary with records, summary, and dataframe
+            Dictionary with summary and dataframe
 
         Raises:
             ParameterValidationError: If parameters are invalid
         """
         # Validate desk
-        context.logger.info(f"Validating parameters: desk={desk}, date={date}")
+        context.logger.info("Validating parameters: desk=%s, date=%s", desk, date)
 
-        if desk not in TIMELINE_DESKS:
+        if desk not in TIMELINE_DESK_SET:
             raise ParameterValidationError(
                 f"Invalid desk '{desk}'. Must be one of: {TIMELINE_DESKS}",
-                user_message=f"Please select a valid desk: {', '.join(TIMELINE_DESKS)}"
+                user_message=f"Please select a valid desk: {_AVAILABLE_DESKS_TEXT}"
             )
 
         # Validate and parse date
+        # Strictly YYYY-MM-DD; the result is midnight of that day.
+        # strptime alone also accepts unpadded months and days ('2024-1-5'),
+        # so the length pins both to two digits.
         try:
-            date_obj = datetime.fromisoformat(date)
+            if len(date) != 10:
+                raise ValueError(f"{date!r} does not match format 'YYYY-MM-DD'")
+            date_obj = datetime.strptime(date, '%Y-%m-%d')
         except ValueError as e:
             raise ParameterValidationError(
                 f"Invalid date format: {e}",
@@ -59,20 +67,14 @@ class TimelineTool(BaseTool):
             )
 
         # Log validated parameters
-        context.logger.info(
-            f"Parameters validated successfully",
-            extra={'desk': desk, 'date': date}
-        )
+        context.logger.info("Parameters validated successfully")
 
         # Create model and fetch data
         context.logger.info("Fetching timeline data")
         model = IngestorTimelineModel()
         df = model.get_timeline_data(desk, date_obj)
 
-        context.logger.info(
-            f"Retrieved {len(df)} timeline records",
-            extra={'record_count': len(df)}
-        )
+        context.logger.info("Retrieved %d timeline records", len(df))
 
         # Process data
         result = model.process_timeline_data(df)
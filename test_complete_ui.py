@@ -62,11 +62,11 @@ try:
     )
 
     if result.success:
-        records = result.data.get('records', [])
+        df = result.data['dataframe']
         print(f"✓ Timeline tool executed successfully")
-        print(f"  - Returned {len(records)} records")
-        if records:
-            print(f"  - Sample record keys: {list(records[0].keys())}")
+        print(f"  - Returned {len(df)} records")
+        if len(df):
+            print(f"  - Sample record keys: {list(df.columns)}")
     else:
         print(f"✗ Timeline tool failed: {result.error_message}")
         sys.exit(1)
@@ -123,19 +123,19 @@ try:
     )
 
     if result.success:
-        records = result.data.get('records', [])
+        df = result.data['dataframe']
         print(f"✓ Force Load dry run executed successfully")
-        print(f"  - Returned {len(records)} records")
-        if records:
+        print(f"  - Returned {len(df)} records")
+        if len(df):
             expected_columns = ['configName', 'key', 'group', 'LastLoadedTS',
                               'ProcessTS', 'COB', 'LoadID', 'DataSourceWindows']
-            actual_columns = list(records[0].keys())
+            actual_columns = list(df.columns)
             missing = set(expected_columns) - set(actual_columns)
             if missing:
                 print(f"✗ Missing columns: {missing}")
                 sys.exit(1)
             print(f"  - All expected columns present: {expected_columns}")
-            print(f"  - Sample record: {records[0]}")
+            print(f"  - Sample record: {df.iloc[0].to_dict()}")
     else:
         print(f"✗ Force Load dry run failed: {result.error_message}")
         sys.exit(1)
@@ -160,9 +160,9 @@ try:
     )
 
     if result.success:
-        records = result.data.get('records', [])
+        df = result.data['dataframe']
         print(f"✓ Force Load run executed successfully")
-        print(f"  - Returned {len(records)} records")
+        print(f"  - Returned {len(df)} records")
     else:
         print(f"✗ Force Load run failed: {result.error_message}")
         sys.exit(1)
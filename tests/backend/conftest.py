@@ -0,0 +1,50 @@
+"""
+Fixtures shared by the backend tests.
+"""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.adapters.logger import get_logger
+from backend.core.base_tool import ExecutionContext
+from backend.models.ingestor_timeline import IngestorTimelineModel, clear_timeline_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_timeline_cache():
+    """Start and end every test with an empty timeline query cache."""
+    clear_timeline_cache()
+    yield
+    clear_timeline_cache()
+
+
+@pytest.fixture
+def make_context():
+    """Factory for the ExecutionContext of a direct tool.run call."""
+    def make(tool_path, **params):
+        request_id = uuid.uuid4().hex
+        return ExecutionContext(
+            request_id=request_id,
+            user='pytest',
+            timestamp=datetime.now(timezone.utc),
+            tool_path=tool_path,
+            params=params,
+            logger=get_logger(tool_path=tool_path, user='pytest', request_id=request_id)
+        )
+
+    return make
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    """Count the backing timeline queries."""
+    calls = []
+    real_query = IngestorTimelineModel._get_mock_data
+
+    def counting_query(self, desk, date):
+        calls.append((desk, date))
+        return real_query(self, desk, date)
+
+    monkeypatch.setattr(IngestorTimelineModel, '_get_mock_data', counting_query)
+    return calls
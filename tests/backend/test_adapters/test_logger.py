@@ -0,0 +1,82 @@
+"""
+Tests for the local logger adapter.
+"""
+import logging
+import logging.handlers
+
+import pytest
+
+from backend.adapters import logger as logger_module
+from backend.adapters.logger import get_logger
+
+
+class RecordCollector(logging.Handler):
+    """Handler that keeps every record it receives."""
+
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def records():
+    """Records logged through get_logger adapters during the test."""
+    target = logger_module._context_logger
+    collector = RecordCollector()
+    old_level = target.level
+    target.addHandler(collector)
+    target.setLevel(logging.DEBUG)
+    yield collector.records
+    target.removeHandler(collector)
+    target.setLevel(old_level)
+
+
+def test_context_does_not_accumulate_across_loggers(records):
+    first = get_logger(tool_path='A', user='alice', request_id='1')
+    second = get_logger(tool_path='B', user='bob', request_id='2')
+
+    second.info("second")
+    first.info("first")
+
+    assert [(r.tool_path, r.user, r.request_id) for r in records] == [
+        ('B', 'bob', '2'),
+        ('A', 'alice', '1'),
+    ]
+    assert logger_module._context_logger.filters == []
+
+
+def test_call_site_extra_is_merged_with_context(records):
+    get_logger(tool_path='A', user='alice', request_id='1').info(
+        "with extra", extra={'table': 'Inflation Env'}
+    )
+
+    record = records[0]
+    assert record.table == 'Inflation Env'
+    assert record.request_id == '1'
+
+
+def test_configure_root_logger_adds_handlers_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(logger_module, '_root_configured', False)
+    monkeypatch.setattr(logger_module, '_log_file', lambda: tmp_path / 'dashboard.log')
+    root = logging.getLogger()
+    old_level = root.level
+    before = list(root.handlers)
+
+    try:
+        logger_module.configure_root_logger()
+        logger_module.configure_root_logger()
+        added = [h for h in root.handlers if h not in before]
+        assert len(added) == 2
+
+        # Log lines are raw UTF-8, so the file must not use the locale encoding
+        file_targets = [h.target for h in added if isinstance(h, logging.handlers.MemoryHandler)]
+        assert [t.encoding for t in file_targets] == ['utf-8']
+    finally:
+        for handler in root.handlers[:]:
+            if handler not in before:
+                root.removeHandler(handler)
+                handler.close()
+        root.setLevel(old_level)
@@ -0,0 +1,48 @@
+"""
+Tests for the backend tool registry.
+"""
+import pytest
+
+from backend.core.base_tool import BaseTool
+from backend.core.registry import Registry
+from backend.lib.errors import ToolNotFoundError
+
+
+@pytest.mark.parametrize('path', list(Registry()._tools))
+def test_every_registered_tool_resolves(path):
+    registry = Registry()
+
+    tool_class = registry._load_tool_class(path)
+    tool = registry.get_tool(path)
+
+    assert issubclass(tool_class, BaseTool)
+    assert type(tool) is tool_class
+    assert registry.get_tool(path) is tool
+
+
+def test_unknown_tool_raises_not_found():
+    with pytest.raises(ToolNotFoundError):
+        Registry().get_tool('RAD/Ingestor/Missing')
+
+
+def test_structure_is_read_only_at_every_level():
+    structure = Registry().get_structure()
+    ingestor = structure['RAD']['Ingestor']
+
+    with pytest.raises(TypeError):
+        structure['RAD']['Extra'] = {}
+    with pytest.raises(AttributeError):
+        ingestor['_tools'].append('Extra')
+    assert ingestor['_tools'] == ('Timeline', 'Force Load')
+
+
+def test_tool_options_are_flattened_once():
+    registry = Registry()
+
+    options = registry.get_tool_options('RAD')
+
+    assert options == (
+        ('Ingestor / Timeline', 'RAD/Ingestor/Timeline'),
+        ('Ingestor / Force Load', 'RAD/Ingestor/Force Load'),
+    )
+    assert registry.get_tool_options('RAD') is options
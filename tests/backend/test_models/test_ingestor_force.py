@@ -0,0 +1,63 @@
+"""
+Tests for the force load model.
+"""
+import copy
+
+import pytest
+
+from backend.lib.errors import ParameterValidationError
+from backend.models.ingestor_force import FORCE_LOAD_TABLES, IngestorForceModel
+
+FULL_ROW = {'configName': 'Config1', 'key': 'inflation.rate', 'group': 'ENV'}
+EMPTY_ROW = {'configName': '', 'key': '', 'group': ''}
+
+
+def test_validate_config_accepts_full_and_empty_rows():
+    IngestorForceModel().validate_config([FULL_ROW, EMPTY_ROW])
+
+
+def test_validate_config_rejects_no_rows():
+    with pytest.raises(ParameterValidationError) as exc_info:
+        IngestorForceModel().validate_config([])
+
+    assert str(exc_info.value) == "Configuration data cannot be empty"
+    assert exc_info.value.user_message == "Please provide at least one configuration row"
+
+
+def test_validate_config_lists_missing_keys_in_order():
+    with pytest.raises(ParameterValidationError) as exc_info:
+        IngestorForceModel().validate_config([FULL_ROW, {'key': 'k'}])
+
+    assert str(exc_info.value) == "Row 1 missing required keys: ['configName', 'group']"
+    assert exc_info.value.user_message == "Row 2 is missing required fields"
+
+
+def test_validate_config_rejects_partially_filled_row():
+    with pytest.raises(ParameterValidationError) as exc_info:
+        IngestorForceModel().validate_config([{**FULL_ROW, 'group': ''}])
+
+    assert str(exc_info.value) == "Row 0 has incomplete data"
+    assert exc_info.value.user_message == "Row 1 must have all fields filled or be empty"
+
+
+def test_default_config_edits_do_not_change_defaults():
+    model = IngestorForceModel()
+    defaults = copy.deepcopy(FORCE_LOAD_TABLES)
+
+    rows = model.get_default_config('Inflation Env')
+    rows[0]['configName'] = 'edited'
+    rows.append(dict(FULL_ROW))
+    del rows[1]
+
+    assert FORCE_LOAD_TABLES == defaults
+    assert model.get_default_config('Inflation Env') == defaults['Inflation Env']['data']
+
+
+def test_execute_force_load_defaults_missing_values():
+    result = IngestorForceModel().execute_force_load(
+        'Inflation Env', [{'configName': 'a'}, EMPTY_ROW]
+    )
+
+    df = result['dataframe']
+    assert result['rows_processed'] == 1
+    assert df[['configName', 'key', 'group']].values.tolist() == [['a', '', '']]
@@ -0,0 +1,92 @@
+"""
+Tests for the timeline model's query cache.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.models import ingestor_timeline
+from backend.models.ingestor_timeline import IngestorTimelineModel, clear_timeline_cache
+
+TODAY = datetime.combine(datetime.now().date(), datetime.min.time())
+YESTERDAY = TODAY - timedelta(days=1)
+LAST_WEEK = TODAY - timedelta(days=7)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the model module."""
+    now = [1000.0]
+    monkeypatch.setattr(ingestor_timeline.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_hit_returns_shallow_copy(queries):
+    model = IngestorTimelineModel()
+
+    first = model.get_timeline_data('Options', TODAY)
+    second = model.get_timeline_data('Options', TODAY)
+
+    assert len(queries) == 1
+    assert first is not second
+    assert first.equals(second)
+
+    # New columns on one copy never reach the cache or other callers
+    first['extra'] = 1
+    assert 'extra' not in model.get_timeline_data('Options', TODAY).columns
+
+
+def test_entry_expires_after_ttl(clock, queries):
+    model = IngestorTimelineModel()
+    model.get_timeline_data('Options', TODAY)
+
+    clock[0] += ingestor_timeline.TIMELINE_CACHE_TTL - 1
+    model.get_timeline_data('Options', TODAY)
+    assert len(queries) == 1
+
+    clock[0] += 2
+    model.get_timeline_data('Options', TODAY)
+    assert len(queries) == 2
+
+
+@pytest.mark.parametrize('date, ttl', [
+    (YESTERDAY, 'TIMELINE_CACHE_TTL'),
+    (LAST_WEEK, 'TIMELINE_PAST_CACHE_TTL'),
+])
+def test_past_entry_expires_after_its_ttl(clock, queries, date, ttl):
+    model = IngestorTimelineModel()
+    model.get_timeline_data('Options', date)
+
+    clock[0] += getattr(ingestor_timeline, ttl) - 1
+    model.get_timeline_data('Options', date)
+    assert len(queries) == 1
+
+    clock[0] += 2
+    model.get_timeline_data('Options', date)
+    assert len(queries) == 2
+
+
+def test_least_recently_used_entry_is_evicted(monkeypatch, queries):
+    monkeypatch.setattr(ingestor_timeline, 'TIMELINE_CACHE_SIZE', 2)
+    model = IngestorTimelineModel()
+
+    model.get_timeline_data('Options', TODAY)
+    model.get_timeline_data('FXG', TODAY)
+    model.get_timeline_data('Options', TODAY)  # FXG is now least recent
+    model.get_timeline_data('LDFX', TODAY)
+    assert len(queries) == 3
+
+    model.get_timeline_data('Options', TODAY)
+    assert len(queries) == 3
+    model.get_timeline_data('FXG', TODAY)
+    assert len(queries) == 4
+
+
+def test_clear_timeline_cache(queries):
+    model = IngestorTimelineModel()
+    model.get_timeline_data('Options', TODAY)
+
+    clear_timeline_cache()
+    model.get_timeline_data('Options', TODAY)
+
+    assert len(queries) == 2
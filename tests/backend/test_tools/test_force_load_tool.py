@@ -0,0 +1,38 @@
+"""
+Tests for the force load tool.
+"""
+from datetime import datetime, timedelta
+
+from backend.models.ingestor_force import get_force_model
+from backend.models.ingestor_timeline import IngestorTimelineModel
+from backend.tools.RAD.ingestor.force_load_tool import ForceLoadTool
+
+TOOL_PATH = 'RAD/Ingestor/Force Load'
+TABLE = 'Inflation Env'
+YESTERDAY = datetime.combine(datetime.now().date(), datetime.min.time()) - timedelta(days=1)
+
+
+def run_force_load(context, **kwargs):
+    """Force load the default config for TABLE."""
+    config = get_force_model().get_default_config(TABLE)
+    return ForceLoadTool().run(context, table_name=TABLE, config=config, **kwargs)
+
+
+def test_force_load_drops_cached_past_cobs(make_context, queries):
+    model = IngestorTimelineModel()
+    model.get_timeline_data('Options', YESTERDAY)
+
+    run_force_load(make_context(TOOL_PATH), action='force_load', dry_run=False)
+    model.get_timeline_data('Options', YESTERDAY)
+
+    assert len(queries) == 2
+
+
+def test_dry_run_keeps_cached_timelines(make_context, queries):
+    model = IngestorTimelineModel()
+    model.get_timeline_data('Options', YESTERDAY)
+
+    run_force_load(make_context(TOOL_PATH), action='force_load', dry_run=True)
+    model.get_timeline_data('Options', YESTERDAY)
+
+    assert len(queries) == 1
@@ -0,0 +1,24 @@
+"""
+Tests for the timeline query tool.
+"""
+import pytest
+
+from backend.lib.errors import ParameterValidationError
+from backend.tools.RAD.ingestor.timeline_tool import TimelineTool
+
+TOOL_PATH = 'RAD/Ingestor/Timeline'
+
+
+def test_run_accepts_iso_date(make_context):
+    result = TimelineTool().run(make_context(TOOL_PATH), desk='Options', date='2024-01-15')
+
+    assert result['summary']['total_records'] == len(result['dataframe'])
+    assert result['dataframe']['COB'].iloc[0].isoformat() == '2024-01-15'
+
+
+@pytest.mark.parametrize('date', [
+    '20240115', '2024-W03-1', '15/01/2024', '', '2024-1-5', '2024-01-5', '2024-1-15',
+])
+def test_run_rejects_non_yyyy_mm_dd_dates(make_context, date):
+    with pytest.raises(ParameterValidationError):
+        TimelineTool().run(make_context(TOOL_PATH), desk='Options', date=date)
@@ -0,0 +1,23 @@
+"""
+Tests for the DataFrame table component.
+"""
+import pandas as pd
+
+from ui.components.dataframe_table import DataFrameTable
+
+
+def test_text_is_escaped_and_only_bool_columns_are_styled():
+    df = pd.DataFrame({
+        'note': ['✓', '<b>bold</b>'],
+        'a&b': [1, 2],
+        'flag': [True, False],
+    })
+
+    html = DataFrameTable(df).table_html.value
+
+    assert '<td>✓</td>' in html
+    assert '&lt;b&gt;bold&lt;/b&gt;' in html
+    assert '<th>a&amp;b</th>' in html
+    assert "<span class='nlrad-true'>✓</span>" in html
+    assert "<span class='nlrad-false'>✗</span>" in html
+    assert html.count('nlrad-true') == 1
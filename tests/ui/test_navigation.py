@@ -0,0 +1,24 @@
+"""
+Tests for the navigation sidebar.
+"""
+import ipywidgets as widgets
+
+from backend.core.registry import Registry
+from ui.components.navigation import Navigation
+
+
+def test_same_tool_can_be_selected_again():
+    navigation = Navigation(Registry())
+    selected = []
+    navigation.on_tool_selected(selected.append)
+
+    # The first category is opened (and built) on load
+    first_category = navigation.widget.children[1]
+    tool_select = first_category.children[0].children[0]
+    assert isinstance(tool_select, widgets.Select)
+
+    tool_path = tool_select.options[0][1]
+    tool_select.value = tool_path
+    tool_select.value = tool_path
+
+    assert selected == [tool_path, tool_path]
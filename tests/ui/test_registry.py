@@ -0,0 +1,25 @@
+"""
+Tests for the UI tool registry.
+"""
+import pytest
+
+from backend.core.registry import Registry
+from ui.registry import TOOL_UI_MAP, get_available_tools, get_tool_ui_class
+
+
+@pytest.mark.parametrize('tool_path', list(TOOL_UI_MAP))
+def test_every_registered_ui_resolves(tool_path):
+    ui_class = get_tool_ui_class(tool_path)
+
+    assert isinstance(ui_class, type)
+    assert ui_class.__name__ == TOOL_UI_MAP[tool_path].split(':')[1]
+    assert get_tool_ui_class(tool_path) is ui_class
+
+
+def test_every_ui_has_a_backend_tool():
+    assert set(get_available_tools()) <= set(Registry()._tools)
+
+
+def test_unknown_tool_raises_key_error():
+    with pytest.raises(KeyError):
+        get_tool_ui_class('RAD/Ingestor/Missing')
@@ -0,0 +1,33 @@
+"""
+Tests for the timeline tool UI.
+"""
+import threading
+
+from backend.core.executor import get_executor
+from ui.tools.RAD.ingestor.timeline_ui import TimelineUI
+
+
+class BlockingExecutor:
+    """Executor whose queries wait for release before running."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def execute(self, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        return get_executor().execute(**kwargs)
+
+
+def test_clicks_while_querying_are_ignored():
+    executor = BlockingExecutor()
+    ui = TimelineUI(executor, 'RAD/Ingestor/Timeline')
+
+    future = ui._on_submit(ui.submit_button)
+    assert ui.submit_button.disabled
+    assert ui._on_submit(ui.submit_button) is None
+
+    executor.release.set()
+    future.result(5)
+    assert executor.calls == 1
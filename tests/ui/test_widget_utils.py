@@ -0,0 +1,78 @@
+"""
+Tests for the shared widget helpers.
+"""
+import threading
+
+from ui.lib.widget_utils import LatestTaskRunner
+
+
+class Recorder:
+    """Collects callback values; wait() blocks until one has arrived."""
+
+    def __init__(self):
+        self.values = []
+        self._called = threading.Event()
+
+    def __call__(self, value):
+        self.values.append(value)
+        self._called.set()
+
+    def wait(self):
+        assert self._called.wait(5)
+
+
+def blocked_task(value):
+    """A task returning value once its event is set."""
+    release = threading.Event()
+
+    def task():
+        release.wait(5)
+        return value
+
+    return task, release
+
+
+def test_only_latest_result_reaches_on_done():
+    runner = LatestTaskRunner(loading_delay=10)
+    done, stale = Recorder(), Recorder()
+    first_task, release_first = blocked_task('first')
+    second_task, release_second = blocked_task('second')
+
+    runner.run(first_task, on_done=done, on_stale=stale)
+    runner.run(second_task, on_done=done, on_stale=stale)
+    release_second.set()
+    done.wait()
+    release_first.set()
+    stale.wait()
+
+    assert done.values == ['second']
+    assert stale.values == ['first']
+
+
+def test_loading_fires_only_for_slow_runs():
+    runner = LatestTaskRunner(loading_delay=0.05)
+    loading = threading.Event()
+    slow_task, release = blocked_task('slow')
+
+    future = runner.run(slow_task, on_done=lambda result: None, on_loading=loading.set)
+    assert loading.wait(5)
+    release.set()
+    future.result(5)
+
+    loading.clear()
+    runner.run(lambda: 'fast', on_done=lambda result: None, on_loading=loading.set).result(5)
+    assert not loading.wait(0.2)
+
+
+def test_failed_task_reaches_on_error():
+    runner = LatestTaskRunner(loading_delay=10)
+    done, errors = Recorder(), Recorder()
+
+    def failing_task():
+        raise ValueError('boom')
+
+    runner.run(failing_task, on_done=done, on_error=errors)
+    errors.wait()
+
+    assert done.values == []
+    assert [str(error) for error in errors.values] == ['boom']
@@ -9,6 +9,7 @@ from backend.core.registry import get_registry
 from backend.core.executor import get_executor
 from ui.components.navigation import Navigation
 from ui.components.content_area import ContentArea
+from ui.styles.stylesheet import APP_STYLE
 
 
 # Color palette
@@ -62,7 +63,9 @@ def create_app():
     # Navigation on left (20% width), Content on right (80% width)
     main_layout = widgets.HBox([
         navigation.widget,
-        content_area.widget
+        content_area.widget,
+        # Shared CSS for every component; hidden, but its rules still apply
+        widgets.HTML(APP_STYLE, layout=widgets.Layout(display='none'))
     ])
 
     # Style the layout with professional color scheme
@@ -5,7 +5,12 @@ Displays tool UIs dynamically when selected from navigation.
 """
 import ipywidgets as widgets
 from ui.registry import get_tool_ui_class
-from ui.components.error_display import ErrorDisplay
+from ui.components import error_display
+from ui.lib.widget_utils import LatestTaskRunner, close_widget_tree
+
+
+# Tool UIs that build faster than this never flash the loading indicator
+LOADING_DELAY_SECONDS = 0.05
 
 
 class ContentArea:
@@ -19,6 +24,7 @@ class ContentArea:
     def __init__(self):
         """Initialize content area with welcome message."""
         self.current_tool_ui = None  # Reference to currently loaded tool UI
+        self._loader = LatestTaskRunner(LOADING_DELAY_SECONDS)
 
         # Create main container (VBox = vertical stacking)
         self.widget = widgets.VBox([
@@ -33,9 +39,9 @@ class ContentArea:
             ipywidgets.HTML: Welcome message widget
         """
         return widgets.HTML("""
-            <div style='padding: 40px; text-align: center;'>
+            <div class='nlrad-welcome'>
                 <h1>Welcome to NLRAD Dashboard</h1>
-                <p style='font-size: 16px; color: #666; margin-top: 20px;'>
+                <p>
                     Select a tool from the navigation menu to get started.
                 </p>
             </div>
@@ -52,9 +58,9 @@ class ContentArea:
             ipywidgets.HTML: Loading message widget
         """
         return widgets.HTML(f"""
-            <div style='padding: 40px; text-align: center;'>
+            <div class='nlrad-loading'>
                 <h2>Loading {tool_path}...</h2>
-                <div style='margin-top: 20px; font-size: 24px;'>⏳</div>
+                <div class='nlrad-loading-icon'>⏳</div>
             </div>
         """)
 
@@ -62,39 +68,121 @@ class ContentArea:
         """
         Load and display a tool UI.
 
-        This is called when user clicks a tool in the navigation.
+        This is called when user clicks a tool in the navigation. The tool
+        UI is built on a worker thread so the kernel keeps handling widget
+        messages meanwhile; the content is swapped in when it is ready.
+        If another tool is selected before then, the older result is
+        discarded.
 
         Args:
             tool_path: Full path to tool (e.g., "RAD/ingestor/timeline")
             executor: Executor instance for running the tool
+
+        Returns:
+            concurrent.futures.Future: The background build of the tool UI
+        """
+        return self._loader.run(
+            lambda: self._build_tool(tool_path, executor),
+            on_done=self._finish_load,
+            on_loading=lambda: self._show_loading(tool_path),
+            on_stale=self._discard_load,
+            on_error=lambda error: self._finish_load(
+                (None, [self._create_load_error(tool_path, error)])
+            )
+        )
+
+    def _build_tool(self, tool_path, executor):
         """
-        # Show loading indicator
-        self.widget.children = [self._create_loading_message(tool_path)]
+        Build the content for a tool (runs on a worker thread).
 
+        Args:
+            tool_path: Full path to tool
+            executor: Executor instance for running the tool
+
+        Returns:
+            Tuple of (tool UI instance or None, list of child widgets)
+        """
         try:
             # Get the tool UI class from registry
             tool_ui_class = get_tool_ui_class(tool_path)
 
             # Create instance of the tool UI
             # Pass executor so the UI can execute the tool when user clicks submit
-            self.current_tool_ui = tool_ui_class(executor, tool_path)
+            tool_ui = tool_ui_class(executor, tool_path)
 
-            # Display the tool UI
-            self.widget.children = [
+            return tool_ui, [
                 self._create_tool_header(tool_path),
-                self.current_tool_ui.widget
+                tool_ui.widget
             ]
 
         except Exception as e:
             # If loading fails, show error
-            error_display = ErrorDisplay()
-            self.widget.children = [
-                error_display.create_error_widget(
-                    title="Failed to Load Tool",
-                    message=f"Could not load {tool_path}",
-                    details=str(e)
-                )
-            ]
+            return None, [self._create_load_error(tool_path, e)]
+
+    def _create_load_error(self, tool_path, error):
+        """
+        Create the error shown when a tool UI cannot be built.
+
+        Args:
+            tool_path: Path of tool being loaded
+            error: Exception raised while building it
+
+        Returns:
+            ipywidgets.HTML: Error widget
+        """
+        return error_display.create_error_widget(
+            title="Failed to Load Tool",
+            message=f"Could not load {tool_path}",
+            details=str(error)
+        )
+
+    def _show_loading(self, tool_path):
+        """
+        Show the loading indicator while a slow build runs.
+
+        Args:
+            tool_path: Path of tool being loaded
+        """
+        self._replace_children([self._create_loading_message(tool_path)])
+
+    def _finish_load(self, built):
+        """
+        Display a built tool in a single children update.
+
+        Args:
+            built: (tool UI instance or None, child widgets) from _build_tool
+        """
+        tool_ui, new_children = built
+        self.current_tool_ui = tool_ui
+        self._replace_children(new_children)
+
+    def _discard_load(self, built):
+        """
+        Release a build superseded by a newer selection.
+
+        Its widgets are never shown, so they are closed straight away.
+
+        Args:
+            built: (tool UI instance or None, child widgets) from _build_tool
+        """
+        for child in built[1]:
+            close_widget_tree(child)
+
+    def _replace_children(self, new_children):
+        """
+        Show new_children and close what they replace.
+
+        Whatever is no longer displayed (previous tool UI, loading or
+        welcome message) is closed so its widgets do not linger in the
+        kernel and frontend.
+
+        Args:
+            new_children: Widgets to display
+        """
+        stale_children = self.widget.children
+        self.widget.children = new_children
+        for child in stale_children:
+            close_widget_tree(child)
 
     def _create_tool_header(self, tool_path):
         """
@@ -110,8 +198,8 @@ class ContentArea:
         tool_name = tool_path.split('/')[-1].replace('_', ' ').title()
 
         return widgets.HTML(f"""
-            <div style='border-bottom: 2px solid #ddd; padding-bottom: 10px; margin-bottom: 20px;'>
+            <div class='nlrad-tool-header'>
                 <h2>{tool_name}</h2>
-                <p style='color: #666; font-size: 14px;'>{tool_path}</p>
+                <p>{tool_path}</p>
             </div>
         """)
@@ -2,17 +2,76 @@
 Reusable DataFrame table component with sort and filter.
 
 Provides a consistent, polished table display for any DataFrame.
+Styling comes from the app stylesheet (ui.styles.stylesheet).
 """
+import html
+import threading
+from collections import OrderedDict
 import ipywidgets as widgets
+import numpy as np
 import pandas as pd
-from IPython.display import display
+from ui.lib.widget_utils import shared_layout
 
 
-# Color palette
-SUCCESS_COLOR = '#27ae60'
-HEADER_COLOR = '#34495e'
-ROW_EVEN = '#ffffff'
-ROW_ODD = '#f9f9f9'
+# Quiet period after the last keystroke before the search filter runs
+SEARCH_DEBOUNCE_SECONDS = 0.25
+
+# Rows rendered per page; larger frames are paged with prev/next buttons
+PAGE_SIZE = 200
+
+# Rendered pages kept per table, keyed by search/sort/page state
+HTML_CACHE_SIZE = 32
+
+# Layouts shared by every table; none of them is changed after creation
+# (the pager HBox layout is toggled per table, so it is not shared)
+_SEARCH_BOX_LAYOUT = shared_layout(width='400px', margin='0 0 10px 0')
+_PAGER_BUTTON_LAYOUT = shared_layout(width='110px')
+
+# Boolean cells render as check/cross marks, colored by class
+TRUE_MARK = '✓'
+FALSE_MARK = '✗'
+_TRUE_CELL = f"<span class='nlrad-true'>{TRUE_MARK}</span>"
+_FALSE_CELL = f"<span class='nlrad-false'>{FALSE_MARK}</span>"
+
+
+def _format_bool(value):
+    """Render a boolean cell as a colored check or cross mark."""
+    return _TRUE_CELL if value else _FALSE_CELL
+
+
+def _needs_escaping(col):
+    """
+    Whether a column's rendered text can contain HTML special characters.
+
+    Numbers, dates and durations render as plain digits and separators;
+    booleans are rendered by _format_bool.
+
+    Args:
+        col: pandas Series
+
+    Returns:
+        bool: True for text-like columns (object, string, category)
+    """
+    return not (
+        pd.api.types.is_bool_dtype(col)
+        or pd.api.types.is_numeric_dtype(col)
+        or pd.api.types.is_datetime64_any_dtype(col)
+        or pd.api.types.is_timedelta64_dtype(col)
+    )
+
+
+def _escape_column(col):
+    """
+    HTML-escape a column's text, leaving missing values as they are.
+
+    Args:
+        col: pandas Series
+
+    Returns:
+        pd.Series: Escaped strings aligned with col
+    """
+    escaped = col.astype(str).map(html.escape, na_action='ignore')
+    return escaped.where(col.notna(), col)
 
 
 class DataFrameTable:
@@ -22,7 +81,12 @@ class DataFrameTable:
     Features:
     - Click column headers to sort (ascending/descending)
     - Search box to filter across all columns
+    - Pages of PAGE_SIZE rows, so large frames render only what is shown
     - Styled, professional appearance
+
+    The DataFrame passed in is never modified. Search and sort replace
+    current_df with new frames (boolean indexing, sort_values) instead of
+    editing it in place, so no defensive copies are taken.
     """
 
     def __init__(self, df, title=None):
@@ -33,11 +97,17 @@ class DataFrameTable:
             df: pandas DataFrame to display
             title: Optional title to show above table
         """
-        self.original_df = df.copy()
-        self.current_df = df.copy()
+        self.original_df = df
+        self.current_df = df
         self.sort_column = None
         self.sort_ascending = True
+        self.page = 0
         self.title = title
+        self._search_text = ''
+        self._html_cache = OrderedDict()  # (search, sort, page) -> table HTML
+        self._search_index = None  # Lowercased string columns, built on first search
+        self._search_timer = None  # Pending debounced search
+        self._update_lock = threading.Lock()  # Serializes search/sort/page updates
 
         # Create widgets
         self.widget = self._build_widget()
@@ -53,12 +123,7 @@ class DataFrameTable:
         widgets_list = []
         if self.title:
             title_widget = widgets.HTML(f"""
-                <div style='
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: {HEADER_COLOR};
-                    margin-bottom: 10px;
-                '>
+                <div class='nlrad-table-title'>
                     {self.title}
                 </div>
             """)
@@ -68,33 +133,105 @@ class DataFrameTable:
         self.search_box = widgets.Text(
             placeholder='Search...',
             description='Filter:',
-            layout=widgets.Layout(width='400px', margin='0 0 10px 0')
+            layout=_SEARCH_BOX_LAYOUT
         )
-        self.search_box.observe(self._on_search, names='value')
+        self.search_box.observe(self._on_search_change, names='value')
         widgets_list.append(self.search_box)
 
-        # Table output
-        self.table_output = widgets.Output()
-        with self.table_output:
-            display(widgets.HTML(self._create_table_html()))
-        widgets_list.append(self.table_output)
+        # Table (re-rendered in place by updating its value)
+        self.table_html = widgets.HTML(self._render_table())
+        widgets_list.append(self.table_html)
+
+        # Pager (hidden while everything fits on one page)
+        self.prev_button = widgets.Button(
+            description='Previous',
+            icon='chevron-left',
+            layout=_PAGER_BUTTON_LAYOUT
+        )
+        self.next_button = widgets.Button(
+            description='Next',
+            icon='chevron-right',
+            layout=_PAGER_BUTTON_LAYOUT
+        )
+        self.page_label = widgets.HTML()
+        self.prev_button.on_click(lambda b: self._on_page_click(-1))
+        self.next_button.on_click(lambda b: self._on_page_click(1))
+        self.pager = widgets.HBox(
+            [self.prev_button, self.page_label, self.next_button],
+            layout=widgets.Layout(justify_content='flex-end', align_items='center')
+        )
+        self._update_pager()
+        widgets_list.append(self.pager)
 
         return widgets.VBox(widgets_list)
 
-    def _on_search(self, change):
-        """Handle search box changes."""
-        search_text = change['new'].lower()
+    def set_data(self, df):
+        """
+        Show a different DataFrame in this table, reusing its widgets.
+
+        Search text, sort and page are reset.
+
+        Args:
+            df: pandas DataFrame to display
+        """
+        self.search_box.value = ''
+
+        with self._update_lock:
+            if self._search_timer is not None:
+                self._search_timer.cancel()
+            self.original_df = df
+            self.current_df = df
+            self.sort_column = None
+            self.sort_ascending = True
+            self.page = 0
+            self._search_text = ''
+            self._html_cache.clear()
+            self._search_index = None
+            self._refresh_table()
+
+    def _on_search_change(self, change):
+        """
+        Handle search box changes.
+
+        Keystrokes are debounced: each one restarts a short timer, and the
+        filter only runs once typing pauses.
+        """
+        if self._search_timer is not None:
+            self._search_timer.cancel()
+
+        self._search_timer = threading.Timer(SEARCH_DEBOUNCE_SECONDS, self._on_search)
+        self._search_timer.daemon = True
+        self._search_timer.start()
+
+    def _on_search(self):
+        """Filter the table by the current search box text."""
+        with self._update_lock:
+            self._apply_search(self.search_box.value.lower())
+
+    def _apply_search(self, search_text):
+        """
+        Filter original_df by search text and refresh the table.
+
+        Args:
+            search_text: Lowercased text to match in any column
+        """
+        self._search_text = search_text
 
         if not search_text:
             # No search, show all
-            self.current_df = self.original_df.copy()
+            self.current_df = self.original_df
         else:
-            # Filter rows where any column contains search text
-            mask = self.original_df.astype(str).apply(
-                lambda row: row.str.lower().str.contains(search_text).any(),
-                axis=1
-            )
-            self.current_df = self.original_df[mask].copy()
+            # Filter rows where any column contains search text (plain
+            # substring match, one vectorized pass per column)
+            search_index = self._get_search_index()
+            mask = np.zeros(len(search_index), dtype=bool)
+            for col in search_index.columns:
+                mask |= search_index[col].str.contains(
+                    search_text, regex=False
+                ).to_numpy(dtype=bool)
+            self.current_df = self.original_df[mask]
+
+        self.page = 0
 
         # Re-apply sort if active
         if self.sort_column:
@@ -106,8 +243,34 @@ class DataFrameTable:
         # Refresh table
         self._refresh_table()
 
+    def _get_search_index(self):
+        """
+        Get the lowercased string form of original_df used for searching.
+
+        Built once on first use, so each keystroke only runs the
+        substring matches.
+
+        Returns:
+            pd.DataFrame: String columns aligned with original_df
+        """
+        if self._search_index is None:
+            self._search_index = self.original_df.astype(str).apply(
+                lambda col: col.str.lower()
+            )
+        return self._search_index
+
     def _on_sort_click(self, column):
         """Handle column header click for sorting."""
+        with self._update_lock:
+            self._apply_sort(column)
+
+    def _apply_sort(self, column):
+        """
+        Sort by column, toggling direction if it is already the sort column.
+
+        Args:
+            column: Column name to sort by
+        """
         if self.sort_column == column:
             # Toggle sort order
             self.sort_ascending = not self.sort_ascending
@@ -121,15 +284,66 @@ class DataFrameTable:
             by=column,
             ascending=self.sort_ascending
         )
+        self.page = 0
 
         # Refresh table
         self._refresh_table()
 
+    def _on_page_click(self, step):
+        """
+        Handle pager button clicks.
+
+        Args:
+            step: -1 for the previous page, 1 for the next page
+        """
+        with self._update_lock:
+            page = self.page + step
+            if 0 <= page < self._page_count():
+                self.page = page
+                self._refresh_table()
+
+    def _page_count(self):
+        """Number of pages needed for current_df (at least 1)."""
+        return max(1, -(-len(self.current_df) // PAGE_SIZE))
+
+    def _update_pager(self):
+        """Sync pager label, button states and visibility with the page."""
+        page_count = self._page_count()
+        self.page_label.value = (
+            f"<span class='nlrad-table-page'>"
+            f"Page {self.page + 1} of {page_count}</span>"
+        )
+        self.prev_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= page_count - 1
+        self.pager.layout.display = None if page_count > 1 else 'none'
+
     def _refresh_table(self):
         """Refresh the table display."""
-        self.table_output.clear_output()
-        with self.table_output:
-            display(widgets.HTML(self._create_table_html()))
+        self.table_html.value = self._render_table()
+        self._update_pager()
+
+    def _render_table(self):
+        """
+        Get the table HTML for the current state, reusing earlier renders.
+
+        Toggling a sort twice or deleting search characters returns to a
+        state that was already rendered, so the HTML is cached per
+        (search, sort column, sort direction, page).
+
+        Returns:
+            str: HTML table string
+        """
+        key = (self._search_text, self.sort_column, self.sort_ascending, self.page)
+        html = self._html_cache.get(key)
+        if html is not None:
+            self._html_cache.move_to_end(key)
+            return html
+
+        html = self._create_table_html()
+        self._html_cache[key] = html
+        if len(self._html_cache) > HTML_CACHE_SIZE:
+            self._html_cache.popitem(last=False)
+        return html
 
     def _create_table_html(self):
         """
@@ -142,101 +356,57 @@ class DataFrameTable:
 
         if len(df) == 0:
             return """
-                <div style='padding: 20px; text-align: center; color: #7f8c8d;'>
+                <div class='nlrad-table-empty'>
                     No data to display
                 </div>
             """
 
-        # Start table
-        html = f"""
-        <div style='max-height: 500px; overflow: auto; border: 1px solid #ddd; border-radius: 5px;'>
-            <table style='
-                width: 100%;
-                border-collapse: collapse;
-                font-size: 14px;
-            '>
-                <thead style='
-                    position: sticky;
-                    top: 0;
-                    background-color: {HEADER_COLOR};
-                    color: white;
-                    border-bottom: 2px solid #2c3e50;
-                '>
-                    <tr>
-        """
-
-        # Add column headers (clickable for sorting)
-        for col in df.columns:
-            # Sort indicator
-            indicator = ''
-            if self.sort_column == col:
-                indicator = ' ↓' if self.sort_ascending else ' ↑'
-
-            html += f"""
-                        <th style='
-                            padding: 12px;
-                            text-align: left;
-                            font-weight: bold;
-                            cursor: pointer;
-                            user-select: none;
-                        ' onclick='alert("Sorting not available in static HTML")'>
-                            {col}{indicator}
-                        </th>
-            """
-
-        html += """
-                    </tr>
-                </thead>
-                <tbody>
-        """
-
-        # Add data rows
-        for idx, row in df.iterrows():
-            # Alternate row colors
-            bg_color = ROW_EVEN if idx % 2 == 0 else ROW_ODD
-            html += f"<tr style='background-color: {bg_color};'>"
-
-            for col in df.columns:
-                value = row[col]
-
-                # Format boolean values
-                if isinstance(value, bool):
-                    formatted_value = '✓' if value else '✗'
-                    color = SUCCESS_COLOR if value else '#e74c3c'
-                    html += f"""
-                        <td style='padding: 10px; color: {color}; font-weight: bold;'>
-                            {formatted_value}
-                        </td>
-                    """
-                else:
-                    html += f"<td style='padding: 10px;'>{value}</td>"
-
-            html += "</tr>"
-
-        html += """
-                </tbody>
-            </table>
-        </div>
-        """
+        # Only the current page is rendered
+        start = self.page * PAGE_SIZE
+        page_df = df.iloc[start:start + PAGE_SIZE]
+
+        # Mark the sorted column in its header
+        if self.sort_column is not None:
+            indicator = ' ↓' if self.sort_ascending else ' ↑'
+            page_df = page_df.rename(columns={self.sort_column: f"{self.sort_column}{indicator}"})
+
+        # Text columns and headers are escaped here, one pass per column,
+        # so pandas can render without escaping and boolean columns can
+        # emit their own markup. Missing values stay missing, so pandas
+        # still renders them as NaN/None.
+        if len(page_df.columns):
+            page_df = pd.concat([
+                _escape_column(values) if _needs_escaping(values) else values
+                for _, values in page_df.items()
+            ], axis=1)
+        page_df.columns = [html.escape(str(col)) for col in page_df.columns]
+        bool_columns = page_df.select_dtypes(include='bool').columns
+        table_html = page_df.to_html(
+            index=False,
+            escape=False,
+            border=0,
+            classes='nlrad-table',
+            justify='left',
+            formatters={col: _format_bool for col in bool_columns}
+        )
 
-        # Add row count
+        # Row count
         total_rows = len(self.original_df)
         shown_rows = len(df)
         count_text = f"Showing {shown_rows} of {total_rows} rows" if shown_rows != total_rows else f"{total_rows} rows"
+        if shown_rows > PAGE_SIZE:
+            count_text = f"Rows {start + 1}-{start + len(page_df)} · {count_text}"
 
-        html += f"""
-        <div style='
-            padding: 10px;
-            font-size: 12px;
-            color: #7f8c8d;
-            text-align: right;
-        '>
+        # Table and row count in one piece
+        return f"""
+        <div class='nlrad-table-scroll'>
+            {table_html}
+        </div>
+        <div class='nlrad-table-count'>
             {count_text}
         </div>
         """
 
-        return html
-
 
 def create_dataframe_table(df, title=None):
     """
@@ -4,12 +4,16 @@ Navigation sidebar component with polished styling.
 Displays available tools in a hierarchical structure.
 """
 import ipywidgets as widgets
+from ui.lib.widget_utils import shared_layout
 
 
 # Color palette
 SIDEBAR_BG = '#2c3e50'  # Dark blue-gray
 BUTTON_COLOR = '#3498db'  # Blue
-TEXT_COLOR = '#ffffff'  # White
+
+# Layout shared by every category's tool Select (one Layout widget, not
+# one per category)
+_TOOL_SELECT_LAYOUT = shared_layout(width='100%')
 
 
 class Navigation:
@@ -17,7 +21,7 @@ class Navigation:
     Sidebar navigation with tool selection.
 
     Shows tools from the registry in an organized structure.
-    When a tool is clicked, emits an event that the app can handle.
+    When a tool is selected, emits an event that the app can handle.
     """
 
     def __init__(self, registry):
@@ -29,6 +33,7 @@ class Navigation:
         """
         self.registry = registry
         self.callbacks = []  # List of callback functions
+        self._built = set()  # Categories whose tool widgets exist
         self.widget = self._build_navigation()
 
     def _build_navigation(self):
@@ -41,45 +46,32 @@ class Navigation:
         # Get hierarchical structure from registry
         structure = self.registry.get_structure()
 
-        # Create title with styling
-        title = widgets.HTML(f"""
-            <div style='
-                padding: 15px;
-                background-color: {SIDEBAR_BG};
-                color: {TEXT_COLOR};
-                text-align: center;
-                font-size: 20px;
-                font-weight: bold;
-                border-bottom: 2px solid #34495e;
-            '>
+        # Create title (styled by the app stylesheet)
+        title = widgets.HTML("""
+            <div class='nlrad-nav-title'>
                 Tools
             </div>
         """)
 
-        # Create tool buttons for each category
+        # One collapsible section per top-level category. Its tool list is
+        # only built when first expanded.
         tool_widgets = []
 
-        for category, subcategories in structure.items():
-            # Category header
-            category_header = widgets.HTML(f"""
-                <div style='
-                    padding: 10px 15px 5px 15px;
-                    color: {TEXT_COLOR};
-                    font-size: 16px;
-                    font-weight: bold;
-                    background-color: {SIDEBAR_BG};
-                '>
-                    {category}
-                </div>
-            """)
-            tool_widgets.append(category_header)
-
-            # Process subcategories
-            self._add_subcategory_widgets(
-                subcategories,
-                f"{category}",
-                tool_widgets
-            )
+        for category in structure:
+            section = widgets.Accordion(children=[widgets.VBox()])
+            section.set_title(0, category)
+            section.selected_index = None  # Start collapsed
+
+            def on_expand(change, section=section, category=category):
+                if change['new'] is not None:
+                    self._build_category(section, category)
+
+            section.observe(on_expand, names='selected_index')
+            tool_widgets.append(section)
+
+        # Open the first category so its tools are visible on load
+        if tool_widgets:
+            tool_widgets[0].selected_index = 0
 
         # VBox = Vertical Box (stacked layout)
         return widgets.VBox(
@@ -89,74 +81,41 @@ class Navigation:
             )
         )
 
-    def _add_subcategory_widgets(self, subcategories, prefix, tool_widgets):
-        """
-        Recursively add subcategory and tool widgets.
-
-        Args:
-            subcategories: Dictionary of subcategories
-            prefix: Path prefix (e.g., "RAD")
-            tool_widgets: List to append widgets to
-        """
-        for key, value in subcategories.items():
-            if key == '_tools':
-                # This is the list of tool names
-                for tool_name in value:
-                    full_path = f"{prefix}/{tool_name}"
-                    tool_button = self._create_tool_button(tool_name, full_path)
-                    tool_widgets.append(tool_button)
-            else:
-                # This is a subcategory
-                subcat_header = widgets.HTML(f"""
-                    <div style='
-                        padding: 8px 15px 5px 25px;
-                        color: {TEXT_COLOR};
-                        font-size: 14px;
-                        font-weight: bold;
-                        background-color: {SIDEBAR_BG};
-                        opacity: 0.9;
-                    '>
-                        {key}
-                    </div>
-                """)
-                tool_widgets.append(subcat_header)
-
-                # Recursively process this subcategory
-                self._add_subcategory_widgets(
-                    value,
-                    f"{prefix}/{key}",
-                    tool_widgets
-                )
-
-    def _create_tool_button(self, tool_name, full_path):
+    def _build_category(self, section, category):
         """
-        Create a button for a tool.
+        Fill a category section with its tool list on first expansion.
 
         Args:
-            tool_name: Display name of the tool
-            full_path: Full path (e.g., "RAD/Ingestor/Timeline")
-
-        Returns:
-            ipywidgets.Button: Tool button
+            section: Accordion holding the category
+            category: Top-level category name (e.g., "RAD")
         """
-        # Create a button with the tool name (already properly formatted)
-        button = widgets.Button(
-            description=tool_name,  # Tool name is already capitalized
-            layout=widgets.Layout(
-                width='90%',
-                margin='2px 0 2px 25px'
-            ),
-            button_style='info',  # Blue button
-            tooltip=f'Open {tool_name}'
+        if category in self._built:
+            return
+
+        # Flattened once per registry, reused by every later Navigation
+        options = self.registry.get_tool_options(category)
+
+        # One Select per category instead of a Button per tool
+        tool_select = widgets.Select(
+            options=options,
+            value=None,  # Nothing selected until the user picks a tool
+            rows=min(20, len(options)),
+            layout=_TOOL_SELECT_LAYOUT
         )
 
-        # When clicked, emit the tool_selected event
-        def on_click(b):
-            self._emit_tool_selected(full_path)
+        def on_select(change):
+            # Ignore the reset below
+            if change['new'] is None:
+                return
+            self._emit_tool_selected(change['new'])
+            # A Select only fires on change; clearing it lets the same
+            # tool be picked again (e.g. to retry after a failed load)
+            tool_select.value = None
 
-        button.on_click(on_click)
+        tool_select.observe(on_select, names='value')
 
-        return button
+        section.children[0].children = [tool_select]
+        self._built.add(category)
 
     def on_tool_selected(self, callback):
         """
@@ -0,0 +1,186 @@
+"""
+Widget helpers shared by tool UIs.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import ipywidgets as widgets
+
+
+logger = logging.getLogger(__name__)
+
+# Layouts made by shared_layout; close_widget_tree leaves them open
+_shared_layouts = set()
+
+# Runs LatestTaskRunner work off the kernel's message-handling thread
+_task_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='nlrad-ui')
+
+
+def shared_layout(**kwargs):
+    """
+    Create a Layout to be passed to many widgets.
+
+    The frontend syncs one Layout model however many widgets use it.
+    Layouts created here survive close_widget_tree on any of their users.
+
+    Args:
+        **kwargs: Layout traits (width, padding, ...)
+
+    Returns:
+        ipywidgets.Layout: The shared layout
+    """
+    layout = widgets.Layout(**kwargs)
+    _shared_layouts.add(layout)
+    return layout
+
+
+def close_widget_tree(widget):
+    """
+    Close a widget and every widget nested in its children.
+
+    Widget.close only tears down the widget itself; containers leave their
+    children alive, and every widget leaves its own Layout and style
+    models alive, in both the kernel and the frontend. This closes all of
+    them except layouts from shared_layout.
+
+    Args:
+        widget: Root ipywidgets widget to close
+    """
+    stack = [widget]
+    while stack:
+        current = stack.pop()
+        stack.extend(getattr(current, 'children', ()))
+
+        layout = getattr(current, 'layout', None)
+        if layout is not None and layout not in _shared_layouts:
+            layout.close()
+        style = getattr(current, 'style', None)
+        if style is not None:
+            style.close()
+
+        current.close()
+
+
+class LatestTaskRunner:
+    """
+    Run work in the background and display only the latest result.
+
+    Each run supersedes the earlier ones: only the newest run's result
+    reaches on_done, and older results go to on_stale (if given) once
+    they finish. A run whose task raises is logged, and if it is the
+    newest its exception goes to on_error instead of on_done. With cancel_queued, an earlier run still waiting for a
+    worker is cancelled instead. on_loading fires only if the run is
+    still going after loading_delay seconds, so fast work goes straight
+    from the previous display to its result.
+
+    Callbacks run on worker and timer threads, holding the runner's lock
+    (except on_stale), so checking for the newest run and updating the
+    display happen together. Assigning widget traits from there is safe.
+    """
+
+    def __init__(self, loading_delay, cancel_queued=False):
+        """
+        Initialize runner.
+
+        Args:
+            loading_delay: Seconds before on_loading fires for a slow run
+            cancel_queued: If True, a new run cancels an earlier one that
+                has not started yet
+        """
+        self.loading_delay = loading_delay
+        self.cancel_queued = cancel_queued
+        self._lock = threading.Lock()
+        self._seq = 0  # Incremented per run
+        self._done_seq = 0  # Latest run whose result reached on_done
+        self._pending = None  # Future of the latest run
+
+    def run(self, task, on_done, on_loading=None, on_start=None, on_stale=None,
+            on_error=None):
+        """
+        Start task on a worker thread, superseding earlier runs.
+
+        Args:
+            task: Callable taking no arguments
+            on_done: Called with task's result if this is still the latest run
+            on_loading: Called with no arguments if the run is slow
+            on_start: Called with no arguments once this run is the latest,
+                before task is submitted
+            on_stale: Called with task's result if a newer run replaced this one
+            on_error: Called with the exception if task raised and this is
+                still the latest run, so the display can leave its
+                loading state
+
+        Returns:
+            concurrent.futures.Future: The background run of task
+        """
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            if self.cancel_queued and self._pending is not None:
+                self._pending.cancel()
+            if on_start is not None:
+                on_start()
+            future = _task_pool.submit(task)
+            self._pending = future
+
+        loading_timer = None
+        if on_loading is not None:
+            loading_timer = threading.Timer(
+                self.loading_delay, self._show_loading, args=(seq, on_loading)
+            )
+            loading_timer.daemon = True
+            loading_timer.start()
+
+        future.add_done_callback(
+            lambda f: self._finish(f, seq, loading_timer, on_done, on_stale, on_error)
+        )
+        return future
+
+    def _show_loading(self, seq, on_loading):
+        """
+        Call on_loading if run seq is still the latest and unfinished.
+
+        Args:
+            seq: Run sequence number the indicator belongs to
+            on_loading: Loading callback of that run
+        """
+        with self._lock:
+            if seq == self._seq and seq != self._done_seq:
+                on_loading()
+
+    def _finish(self, future, seq, loading_timer, on_done, on_stale, on_error):
+        """
+        Hand a finished run's result to on_done or on_stale.
+
+        A done callback's exceptions are only logged by concurrent.futures,
+        so a failed task is handled here: without it the display would
+        stay in its loading state.
+
+        Args:
+            future: Completed future of the run
+            seq: Run sequence number
+            loading_timer: Pending loading timer to cancel, or None
+            on_done: Callback for the latest run's result
+            on_stale: Callback for a superseded run's result, or None
+            on_error: Callback for the latest run's exception, or None
+        """
+        if loading_timer is not None:
+            loading_timer.cancel()
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is not None:
+            logger.error("Background task failed: %s", error, exc_info=error)
+
+        with self._lock:
+            latest = seq == self._seq
+            if latest:
+                self._done_seq = seq
+                if error is None:
+                    on_done(future.result())
+                elif on_error is not None:
+                    on_error(error)
+
+        if not latest and error is None and on_stale is not None:
+            on_stale(future.result())
@@ -4,19 +4,24 @@ UI Tool Registry.
 Maps tool paths to UI classes. This keeps UI and backend separate
 while providing explicit control over tool-to-UI mapping.
 """
+import importlib
 from typing import Dict, Type
 
-# Import UI classes
-from ui.tools.RAD.ingestor.timeline_ui import TimelineUI
-from ui.tools.RAD.ingestor.force_load_ui import ForceLoadUI
 
-
-# Map tool paths to UI classes
-TOOL_UI_MAP: Dict[str, Type] = {
-    'RAD/Ingestor/Timeline': TimelineUI,
-    'RAD/Ingestor/Force Load': ForceLoadUI,
+# Map tool paths to UI classes as "module:ClassName" references. A UI
+# module (and the ipywidgets/pandas it pulls in) is only imported the
+# first time its tool is opened.
+TOOL_UI_MAP: Dict[str, str] = {
+    'RAD/Ingestor/Timeline': 'ui.tools.RAD.ingestor.timeline_ui:TimelineUI',
+    'RAD/Ingestor/Force Load': 'ui.tools.RAD.ingestor.force_load_ui:ForceLoadUI',
 }
 
+# UI classes already imported, by tool path
+_ui_classes: Dict[str, Type] = {}
+
+# Registered tool paths; TOOL_UI_MAP is fixed at import
+_AVAILABLE_TOOLS = tuple(TOOL_UI_MAP)
+
 
 def get_tool_ui_class(tool_path: str):
     """
@@ -31,19 +36,27 @@ def get_tool_ui_class(tool_path: str):
     Raises:
         KeyError: If tool path not found
     """
+    ui_class = _ui_classes.get(tool_path)
+    if ui_class is not None:
+        return ui_class
+
     if tool_path not in TOOL_UI_MAP:
         raise KeyError(
             f"No UI class registered for tool '{tool_path}'. "
             f"Available tools: {list(TOOL_UI_MAP.keys())}"
         )
-    return TOOL_UI_MAP[tool_path]
+
+    module_name, class_name = TOOL_UI_MAP[tool_path].split(':')
+    module = importlib.import_module(module_name)
+    ui_class = getattr(module, class_name)
+    return _ui_classes.setdefault(tool_path, ui_class)
 
 
 def get_available_tools():
     """
-    Get list of all tools with UI registered.
+    Get all tools with UI registered.
 
     Returns:
-        List of tool paths
+        Tuple of tool paths
     """
-    return list(TOOL_UI_MAP.keys())
+    return _AVAILABLE_TOOLS
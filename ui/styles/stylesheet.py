@@ -0,0 +1,196 @@
+"""
+Application stylesheet.
+
+One <style> block injected by create_app. Components reference these
+classes instead of repeating inline style attributes in every widget.
+"""
+
+# Color palette
+SIDEBAR_BG = '#2c3e50'  # Dark blue-gray
+SIDEBAR_BORDER = '#34495e'
+TEXT_LIGHT = '#ffffff'
+TEXT_MUTED = '#666666'
+TEXT_FAINT = '#7f8c8d'
+HEADER_COLOR = '#34495e'
+ROW_EVEN = '#ffffff'
+ROW_ODD = '#f9f9f9'
+SUCCESS_COLOR = '#27ae60'
+ERROR_COLOR = '#e74c3c'
+ALERT_ERROR = '#d32f2f'
+ALERT_ERROR_BG = '#ffebee'
+ALERT_SUCCESS = '#388e3c'
+ALERT_SUCCESS_BG = '#e8f5e9'
+PANEL_BG = '#f5f5f5'
+INFO_BG = '#e3f2fd'
+
+APP_STYLE = f"""
+<style>
+    /* Content area */
+    .nlrad-welcome, .nlrad-loading {{
+        padding: 40px;
+        text-align: center;
+    }}
+    .nlrad-welcome p {{
+        font-size: 16px;
+        color: {TEXT_MUTED};
+        margin-top: 20px;
+    }}
+    .nlrad-loading-icon {{
+        margin-top: 20px;
+        font-size: 24px;
+    }}
+    .nlrad-tool-header {{
+        border-bottom: 2px solid #ddd;
+        padding-bottom: 10px;
+        margin-bottom: 20px;
+    }}
+    .nlrad-tool-header p {{
+        color: {TEXT_MUTED};
+        font-size: 14px;
+    }}
+
+    /* Tool UIs */
+    .nlrad-instructions {{
+        background-color: {PANEL_BG};
+        padding: 15px;
+        border-radius: 5px;
+        margin-bottom: 15px;
+    }}
+    .nlrad-instructions h3 {{
+        margin-top: 0;
+    }}
+    .nlrad-instructions p {{
+        margin-bottom: 0;
+    }}
+    .nlrad-placeholder {{
+        padding: 40px;
+        text-align: center;
+        color: {TEXT_MUTED};
+    }}
+    .nlrad-table-info {{
+        padding: 10px;
+        background-color: {INFO_BG};
+        margin-bottom: 10px;
+        border-radius: 5px;
+    }}
+    .nlrad-query-loading {{
+        text-align: center;
+        padding: 20px;
+    }}
+    .nlrad-query-loading-icon {{
+        font-size: 24px;
+    }}
+
+    /* Navigation */
+    .nlrad-nav-title {{
+        padding: 15px;
+        background-color: {SIDEBAR_BG};
+        color: {TEXT_LIGHT};
+        text-align: center;
+        font-size: 20px;
+        font-weight: bold;
+        border-bottom: 2px solid {SIDEBAR_BORDER};
+    }}
+
+    /* DataFrame table */
+    .nlrad-table-title {{
+        font-size: 18px;
+        font-weight: bold;
+        color: {HEADER_COLOR};
+        margin-bottom: 10px;
+    }}
+    .nlrad-table-scroll {{
+        max-height: 500px;
+        overflow: auto;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+    }}
+    .nlrad-table {{
+        width: 100%;
+        border-collapse: collapse;
+        font-size: 14px;
+    }}
+    .nlrad-table thead th {{
+        position: sticky;
+        top: 0;
+        padding: 12px;
+        text-align: left;
+        font-weight: bold;
+        color: white;
+        background-color: {HEADER_COLOR};
+        border-bottom: 2px solid {SIDEBAR_BG};
+        user-select: none;
+    }}
+    .nlrad-table td {{
+        padding: 10px;
+    }}
+    .nlrad-table tbody tr:nth-child(odd) {{
+        background-color: {ROW_EVEN};
+    }}
+    .nlrad-table tbody tr:nth-child(even) {{
+        background-color: {ROW_ODD};
+    }}
+    .nlrad-true, .nlrad-false {{
+        font-weight: bold;
+    }}
+    .nlrad-true {{
+        color: {SUCCESS_COLOR};
+    }}
+    .nlrad-false {{
+        color: {ERROR_COLOR};
+    }}
+    .nlrad-table-empty {{
+        padding: 20px;
+        text-align: center;
+        color: {TEXT_FAINT};
+    }}
+    .nlrad-table-count {{
+        padding: 10px;
+        font-size: 12px;
+        color: {TEXT_FAINT};
+        text-align: right;
+    }}
+    .nlrad-table-page {{
+        padding: 0 10px;
+        font-size: 12px;
+        color: {TEXT_FAINT};
+    }}
+
+    /* Error and success messages */
+    .nlrad-error, .nlrad-success {{
+        padding: 20px;
+        margin: 20px 0;
+    }}
+    .nlrad-error h3, .nlrad-success h3 {{
+        margin: 0 0 10px 0;
+    }}
+    .nlrad-error p, .nlrad-success p {{
+        margin: 0;
+        color: #333;
+    }}
+    .nlrad-error {{
+        border-left: 4px solid {ALERT_ERROR};
+        background-color: {ALERT_ERROR_BG};
+    }}
+    .nlrad-error h3 {{
+        color: {ALERT_ERROR};
+    }}
+    .nlrad-success {{
+        border-left: 4px solid {ALERT_SUCCESS};
+        background-color: {ALERT_SUCCESS_BG};
+    }}
+    .nlrad-success h3 {{
+        color: {ALERT_SUCCESS};
+    }}
+    .nlrad-error-details {{
+        padding: 10px;
+        background-color: #f5f5f5;
+        border: 1px solid #ddd;
+        font-family: monospace;
+        font-size: 12px;
+        white-space: pre-wrap;
+        max-height: 200px;
+        overflow-y: auto;
+    }}
+</style>
+"""
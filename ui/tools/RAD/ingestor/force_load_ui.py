@@ -4,10 +4,9 @@ Force Load tool UI.
 User interface for managing force load configurations with editable tables.
 """
 import ipywidgets as widgets
-from IPython.display import display
-import pandas as pd
-from ui.components.error_display import ErrorDisplay
+from ui.components import error_display
 from ui.components.dataframe_table import create_dataframe_table
+from ui.lib.widget_utils import close_widget_tree
 from backend.models.ingestor_force import FORCE_LOAD_TABLES
 
 
@@ -16,9 +15,14 @@ BUTTON_PRIMARY = '#3498db'
 BUTTON_SUCCESS = '#27ae60'
 BUTTON_WARNING = '#e67e22'
 BUTTON_DANGER = '#e74c3c'
-BG_LIGHT = '#f5f5f5'
 BORDER_COLOR = '#ddd'
 
+# Dropdown choices; the table set is fixed at import
+_TABLE_NAMES = tuple(FORCE_LOAD_TABLES)
+
+# Columns shown in the editable table
+EDIT_COLUMNS = ('configName', 'key', 'group')
+
 
 class ForceLoadUI:
     """
@@ -32,6 +36,16 @@ class ForceLoadUI:
     - Submit button with dynamic text
     """
 
+    # Fixed attribute set; no per-instance __dict__
+    __slots__ = (
+        'executor', 'tool_path', 'current_data', 'current_table_name',
+        '_cells', 'widget', 'table_dropdown', 'load_button',
+        'table_container', '_placeholder_html', '_header_row',
+        '_info_html', '_rows_box',
+        '_table_view', 'dry_run_checkbox', 'add_row_button',
+        'submit_button', 'output_area'
+    )
+
     def __init__(self, executor, tool_path):
         """
         Initialize Force Load UI.
@@ -42,12 +56,15 @@ class ForceLoadUI:
         """
         self.executor = executor
         self.tool_path = tool_path
-        self.error_display = ErrorDisplay()
 
         # Current table data (list of dicts)
         self.current_data = []
         self.current_table_name = None
 
+        # Cell Text widget -> (row dict, column name), read by the shared
+        # _on_cell_changed handler
+        self._cells = {}
+
         # Create the UI widget
         self.widget = self._build_ui()
 
@@ -61,10 +78,9 @@ class ForceLoadUI:
         # ===== TABLE SELECTION =====
 
         # Dropdown for table selection
-        table_names = list(FORCE_LOAD_TABLES.keys())
         self.table_dropdown = widgets.Dropdown(
-            options=table_names,
-            value=table_names[0],
+            options=_TABLE_NAMES,
+            value=_TABLE_NAMES[0],
             description='Table:',
             style={'description_width': '80px'},
             layout=widgets.Layout(width='400px')
@@ -84,14 +100,50 @@ class ForceLoadUI:
 
         # ===== TABLE EDITOR =====
 
-        # Container for the editable table
-        self.table_container = widgets.VBox([
-            widgets.HTML(f"""
-                <div style='padding: 40px; text-align: center; color: #666;'>
-                    Select a table and click "Load Table" to begin editing.
-                </div>
-            """)
-        ])
+        # Message shown in place of the table until one is loaded
+        self._placeholder_html = widgets.HTML("""
+            <div class='nlrad-placeholder'>
+                Select a table and click "Load Table" to begin editing.
+            </div>
+        """)
+
+        # Column header row, reused by every table render
+        header_widgets = [
+            widgets.HTML(
+                f"<b>{col_name}</b>",
+                layout=widgets.Layout(width='200px', padding='5px')
+            )
+            for col_name in EDIT_COLUMNS
+        ]
+        header_widgets.append(widgets.HTML(
+            "<b>Actions</b>",
+            layout=widgets.Layout(width='80px', padding='5px')
+        ))
+        self._header_row = widgets.HBox(header_widgets)
+
+        # Table view: info banner plus the bordered header and rows. Built
+        # once; renders only refill the rows and the banner text.
+        self._info_html = widgets.HTML()
+        self._rows_box = widgets.VBox()
+        self._table_view = (
+            self._info_html,
+            widgets.VBox([
+                self._header_row,
+                self._rows_box
+            ], layout=widgets.Layout(
+                border=f'1px solid {BORDER_COLOR}',
+                padding='10px',
+                background_color='white'
+            ))
+        )
+
+        # Container for the editable table. Placeholder and table view both
+        # stay in it (one of them hidden), so every widget is reachable
+        # from self.widget when the tool UI is closed.
+        self.table_container = widgets.VBox(
+            (self._placeholder_html,) + self._table_view
+        )
+        self._show_table(False)
 
         # ===== ACTION BUTTONS =====
 
@@ -125,7 +177,9 @@ class ForceLoadUI:
 
         # ===== OUTPUT AREA =====
 
-        self.output_area = widgets.Output(
+        # Results, loading and error messages. A plain container (not an
+        # Output widget), so shown widgets are children that can be closed.
+        self.output_area = widgets.VBox(
             layout=widgets.Layout(
                 width='100%',
                 border=f'1px solid {BORDER_COLOR}',
@@ -157,10 +211,10 @@ class ForceLoadUI:
 
     def _create_instructions(self):
         """Create instructions text."""
-        return widgets.HTML(f"""
-            <div style='background-color: {BG_LIGHT}; padding: 15px; border-radius: 5px; margin-bottom: 15px;'>
-                <h3 style='margin-top: 0;'>Force Load Configuration</h3>
-                <p style='margin-bottom: 0;'>
+        return widgets.HTML("""
+            <div class='nlrad-instructions'>
+                <h3>Force Load Configuration</h3>
+                <p>
                     Select a table, load the default configuration, edit values as needed,
                     add or remove rows, then submit. Use "Dry Run" to preview results without saving.
                 </p>
@@ -177,18 +231,20 @@ class ForceLoadUI:
     def _on_table_changed(self, change):
         """Handle table dropdown change."""
         # Reset table container when selection changes
-        self.table_container.children = [widgets.HTML("""
-            <div style='padding: 40px; text-align: center; color: #666;'>
+        self._placeholder_html.value = """
+            <div class='nlrad-placeholder'>
                 Click "Load Table" to load this configuration.
             </div>
-        """)]
+        """
+        self._show_table(False)
+        self._clear_rows()
         self.current_data = []
         self.current_table_name = None
         self._disable_buttons()
 
     def _on_load_table(self, button):
         """Load the selected table's default configuration."""
-        self.output_area.clear_output()
+        self._show_output()
 
         table_name = self.table_dropdown.value
 
@@ -208,109 +264,109 @@ class ForceLoadUI:
             self._render_table()
             self._enable_buttons()
         else:
-            with self.output_area:
-                display(self.error_display.create_error_widget(
-                    title="Failed to Load Table",
-                    message=result.user_message or result.error_message,
-                    details=result.traceback
-                ))
+            self._show_output(error_display.create_error_widget(
+                title="Failed to Load Table",
+                message=result.user_message or result.error_message,
+                details=result.traceback
+            ))
 
     def _render_table(self):
         """Render the editable table from current_data."""
         if not self.current_data:
             return
 
-        # Get table schema
-        schema = FORCE_LOAD_TABLES[self.current_table_name]
-        columns = ['configName', 'key', 'group']
+        # Data rows; add/delete later update this box in place
+        self._clear_rows()
+        self._rows_box.children = [
+            self._create_row_widget(row_data) for row_data in self.current_data
+        ]
 
-        # Create input widgets for each row
-        table_widgets = []
+        # Show table info
+        self._update_table_info()
 
-        # Header row
-        header_widgets = [
-            widgets.HTML(
-                "<b>configName</b>",
-                layout=widgets.Layout(width='200px', padding='5px')
-            ),
-            widgets.HTML(
-                "<b>key</b>",
-                layout=widgets.Layout(width='200px', padding='5px')
-            ),
-            widgets.HTML(
-                "<b>group</b>",
-                layout=widgets.Layout(width='200px', padding='5px')
-            ),
-            widgets.HTML(
-                "<b>Actions</b>",
-                layout=widgets.Layout(width='80px', padding='5px')
-            )
-        ]
-        table_widgets.append(widgets.HBox(header_widgets))
-
-        # Data rows with per-row delete buttons
-        for row_idx, row_data in enumerate(self.current_data):
-            row_widgets = []
-
-            # Input fields for each column
-            for col_name in columns:
-                value = row_data.get(col_name, '')
-
-                # Create text input for each cell
-                text_input = widgets.Text(
-                    value=str(value),
-                    layout=widgets.Layout(width='200px'),
-                    continuous_update=False  # Only update on blur/enter
-                )
-
-                # Store reference to update data when changed
-                text_input.row_idx = row_idx
-                text_input.col_name = col_name
-                text_input.observe(self._on_cell_changed, names='value')
-
-                row_widgets.append(text_input)
-
-            # Delete button for this row
-            delete_button = widgets.Button(
-                description='✗',
-                button_style='danger',
-                layout=widgets.Layout(width='60px'),
-                tooltip=f'Delete row {row_idx + 1}'
+        self._show_table(True)
+
+    def _show_table(self, visible):
+        """
+        Switch the table container between the table view and placeholder.
+
+        Args:
+            visible: True to show the table view, False for the placeholder
+        """
+        self._placeholder_html.layout.display = 'none' if visible else None
+        for view_widget in self._table_view:
+            view_widget.layout.display = None if visible else 'none'
+
+    def _clear_rows(self):
+        """Remove and close all row widgets."""
+        rows = self._rows_box.children
+        self._rows_box.children = ()
+        self._cells = {}
+        for row_box in rows:
+            close_widget_tree(row_box)
+
+    def _create_row_widget(self, row_data):
+        """
+        Create the input row for one configuration row.
+
+        Cells write straight into row_data, so edits survive other rows
+        being added or deleted.
+
+        Args:
+            row_data: Row dictionary from current_data
+
+        Returns:
+            ipywidgets.HBox: Text inputs plus a delete button
+        """
+        row_widgets = []
+
+        # Input fields for each column
+        for col_name in EDIT_COLUMNS:
+            value = row_data.get(col_name, '')
+
+            # Create text input for each cell
+            text_input = widgets.Text(
+                value=str(value),
+                layout=widgets.Layout(width='200px'),
+                continuous_update=False  # Only update on blur/enter
             )
-            delete_button.row_idx = row_idx
-            delete_button.on_click(self._on_delete_row)
 
-            row_widgets.append(delete_button)
+            # Record where edits go; one handler serves every cell
+            self._cells[text_input] = (row_data, col_name)
+            text_input.observe(self._on_cell_changed, names='value')
 
-            table_widgets.append(widgets.HBox(row_widgets, layout=widgets.Layout(margin='2px 0')))
+            row_widgets.append(text_input)
 
-        # Show table info
-        info_html = widgets.HTML(f"""
-            <div style='padding: 10px; background-color: #e3f2fd; margin-bottom: 10px; border-radius: 5px;'>
+        # Delete button for this row
+        delete_button = widgets.Button(
+            description='✗',
+            button_style='danger',
+            layout=widgets.Layout(width='60px'),
+            tooltip='Delete row'
+        )
+        row_widgets.append(delete_button)
+
+        row_box = widgets.HBox(row_widgets, layout=widgets.Layout(margin='2px 0'))
+        delete_button.on_click(lambda b: self._delete_row(row_box))
+        return row_box
+
+    def _update_table_info(self):
+        """Refresh the table name, description and row count banner."""
+        schema = FORCE_LOAD_TABLES[self.current_table_name]
+        self._info_html.value = f"""
+            <div class='nlrad-table-info'>
                 <b>Table:</b> {self.current_table_name}<br>
                 <b>Description:</b> {schema['description']}<br>
                 <b>Rows:</b> {len(self.current_data)}
             </div>
-        """)
-
-        self.table_container.children = [
-            info_html,
-            widgets.VBox(table_widgets, layout=widgets.Layout(
-                border=f'1px solid {BORDER_COLOR}',
-                padding='10px',
-                background_color='white'
-            ))
-        ]
+        """
 
     def _on_cell_changed(self, change):
         """Handle cell value change."""
-        widget = change['owner']
-        row_idx = widget.row_idx
-        col_name = widget.col_name
-        new_value = change['new']
+        row_data, col_name = self._cells[change['owner']]
 
         # Update data
-        self.current_data[row_idx][col_name] = new_value
+        row_data[col_name] = change['new']
 
     def _on_add_row(self, button):
         """Add a new empty row."""
@@ -318,42 +374,55 @@ class ForceLoadUI:
             return
 
         # Create empty row with standard columns
-        new_row = {'configName': '', 'key': '', 'group': ''}
+        new_row = {col_name: '' for col_name in EDIT_COLUMNS}
         self.current_data.append(new_row)
 
-        # Re-render table
-        self._render_table()
+        # The first row builds the table; later rows are appended in place
+        if len(self.current_data) == 1:
+            self._render_table()
+            return
 
-    def _on_delete_row(self, button):
-        """Delete a specific row."""
-        row_idx = button.row_idx
+        self._rows_box.children += (self._create_row_widget(new_row),)
+        self._update_table_info()
 
-        if 0 <= row_idx < len(self.current_data):
-            self.current_data.pop(row_idx)
-            self._render_table()
+    def _delete_row(self, row_box):
+        """
+        Delete a specific row.
+
+        Args:
+            row_box: Row widget whose delete button was clicked
+        """
+        children = self._rows_box.children
+        if row_box not in children:
+            return
+
+        # Row widgets and current_data share the same order
+        row_idx = children.index(row_box)
+        self.current_data.pop(row_idx)
+        for cell in row_box.children[:-1]:  # Last child is the delete button
+            self._cells.pop(cell, None)
+        self._rows_box.children = children[:row_idx] + children[row_idx + 1:]
+        close_widget_tree(row_box)
+        self._update_table_info()
 
     def _on_submit(self, button):
         """Submit the changes (either dry run or actual force load)."""
-        self.output_area.clear_output()
-
         if not self.current_data:
-            with self.output_area:
-                display(self.error_display.create_error_widget(
-                    title="No Data",
-                    message="Please load a table first."
-                ))
+            self._show_output(error_display.create_error_widget(
+                title="No Data",
+                message="Please load a table first."
+            ))
             return
 
         # Show loading
-        with self.output_area:
-            is_dry_run = self.dry_run_checkbox.value
-            action_text = "Running dry run" if is_dry_run else "Executing force load"
-            display(widgets.HTML(f"""
-                <div style='text-align: center; padding: 20px;'>
-                    <div style='font-size: 24px;'>⏳</div>
-                    <div>{action_text}...</div>
-                </div>
-            """))
+        is_dry_run = self.dry_run_checkbox.value
+        action_text = "Running dry run" if is_dry_run else "Executing force load"
+        self._show_output(widgets.HTML(f"""
+            <div class='nlrad-query-loading'>
+                <div class='nlrad-query-loading-icon'>⏳</div>
+                <div>{action_text}...</div>
+            </div>
+        """))
 
         # Execute tool
         result = self.executor.execute(
@@ -367,40 +436,48 @@ class ForceLoadUI:
             }
         )
 
-        self.output_area.clear_output()
-
-        with self.output_area:
-            if result.success:
-                self._display_success(result.data, is_dry_run=self.dry_run_checkbox.value)
-            else:
-                display(self.error_display.create_error_widget(
-                    title=result.error_type or "Error",
-                    message=result.user_message or result.error_message,
-                    details=result.traceback
-                ))
+        # Loading indicator stays until the result replaces it
+        if result.success:
+            self._display_success(result.data, is_dry_run=self.dry_run_checkbox.value)
+        else:
+            self._show_output(error_display.create_error_widget(
+                title=result.error_type or "Error",
+                message=result.user_message or result.error_message,
+                details=result.traceback
+            ))
 
     def _display_success(self, data, is_dry_run=True):
         """
         Display successful results.
 
         Args:
-            data: Result data containing DataFrame records
+            data: Result data with a 'dataframe' of result records
             is_dry_run: Whether this was a dry run
         """
-        # Extract records from result
-        records = data.get('records', data)
+        df = data['dataframe']
 
         # Success message
         mode_text = "Dry run" if is_dry_run else "Force load"
-        display(self.error_display.create_success_widget(
-            f"{mode_text} completed successfully - {len(records)} records"
-        ))
+        banner = error_display.create_success_widget(
+            f"{mode_text} completed successfully - {len(df)} records"
+        )
 
-        # Convert to DataFrame and display with reusable component
-        df = pd.DataFrame(records)
+        # Display with reusable component; one update for banner and table
         title = f"{'Dry Run' if is_dry_run else 'Force Load'} Results"
         table_widget = create_dataframe_table(df, title=title)
-        display(table_widget)
+        self._show_output(banner, table_widget)
+
+    def _show_output(self, *shown):
+        """
+        Replace the output area content, closing what it showed before.
+
+        Args:
+            *shown: Widgets to show (none to just clear the area)
+        """
+        previous = self.output_area.children
+        self.output_area.children = shown
+        for widget in previous:
+            close_widget_tree(widget)
 
     def _enable_buttons(self):
         """Enable action buttons."""
@@ -5,13 +5,49 @@ User interface for querying timeline data by desk and date.
 """
 import ipywidgets as widgets
 from datetime import datetime, timedelta
-import pandas as pd
-from IPython.display import display
-from ui.components.error_display import ErrorDisplay
-from ui.components.dataframe_table import create_dataframe_table
+from ui.components import error_display
+from ui.components.dataframe_table import DataFrameTable
+from ui.lib.widget_utils import LatestTaskRunner, shared_layout
 from backend.models.ingestor_timeline import TIMELINE_DESKS
 
 
+# Queries that finish faster than this never flash the loading indicator
+LOADING_DELAY_SECONDS = 0.12
+
+# Shared by every TimelineUI; the frontend syncs each Layout model once
+_CONTROL_LAYOUT = shared_layout(width='300px')
+_SUBMIT_LAYOUT = shared_layout(width='200px')
+_OUTPUT_LAYOUT = shared_layout(
+    width='100%',
+    border='1px solid #ddd',
+    padding='10px',
+    margin='10px 0'
+)
+_CONTROLS_LAYOUT = shared_layout(padding='10px', gap='10px')
+
+_INSTRUCTIONS_HTML = """
+    <div class='nlrad-instructions'>
+        <h3>Timeline Query</h3>
+        <p>
+            Select a desk and date to query timeline data.
+        </p>
+    </div>
+"""
+
+_EMPTY_HTML = """
+    <div class='nlrad-table-empty'>
+        No timeline records for the selected desk and date.
+    </div>
+"""
+
+_LOADING_HTML = """
+    <div class='nlrad-query-loading'>
+        <div class='nlrad-query-loading-icon'>⏳</div>
+        <div>Loading timeline data...</div>
+    </div>
+"""
+
+
 class TimelineUI:
     """
     Timeline tool user interface.
@@ -33,7 +69,9 @@ class TimelineUI:
         """
         self.executor = executor
         self.tool_path = tool_path
-        self.error_display = ErrorDisplay()
+
+        # Only the latest submit is rendered; queued older ones are cancelled
+        self._queries = LatestTaskRunner(LOADING_DELAY_SECONDS, cancel_queued=True)
 
         # Create the UI widget
         self.widget = self._build_ui()
@@ -54,7 +92,7 @@ class TimelineUI:
             value=TIMELINE_DESKS[0],  # Default to first desk
             description='Desk:',
             style={'description_width': '80px'},
-            layout=widgets.Layout(width='300px')
+            layout=_CONTROL_LAYOUT
         )
 
         # Date picker widget
@@ -63,7 +101,7 @@ class TimelineUI:
             description='Date:',
             value=datetime.now().date(),
             style={'description_width': '80px'},
-            layout=widgets.Layout(width='300px')
+            layout=_CONTROL_LAYOUT
         )
 
         # Submit button
@@ -71,7 +109,7 @@ class TimelineUI:
             description='Query Timeline',
             button_style='primary',  # Blue button
             icon='search',
-            layout=widgets.Layout(width='200px')
+            layout=_SUBMIT_LAYOUT
         )
 
         # Connect button click to handler
@@ -80,16 +118,13 @@ class TimelineUI:
 
         # ===== OUTPUT AREA =====
 
-        # Output widget displays dynamic content
-        # We'll put results or errors here
-        self.output_area = widgets.Output(
-            layout=widgets.Layout(
-                width='100%',
-                border='1px solid #ddd',
-                padding='10px',
-                margin='10px 0'
-            )
-        )
+        # Results or errors go here. Every query reuses the same status
+        # HTML and results table, updating their values in place. Both
+        # stay in output_area (the table is hidden when not in use) so
+        # closing this UI's widget tree closes them too.
+        self._status_html = widgets.HTML()
+        self._results_table = None  # DataFrameTable, built on first success
+        self.output_area = widgets.VBox((self._status_html,), layout=_OUTPUT_LAYOUT)
 
         # ===== LAYOUT =====
 
@@ -98,10 +133,7 @@ class TimelineUI:
             self.desk_dropdown,
             self.date_picker,
             self.submit_button
-        ], layout=widgets.Layout(
-            padding='10px',
-            gap='10px'
-        ))
+        ], layout=_CONTROLS_LAYOUT)
 
         # Arrange everything vertically (VBox)
         return widgets.VBox([
@@ -117,36 +149,31 @@ class TimelineUI:
         Returns:
             ipywidgets.HTML: Instructions widget
         """
-        return widgets.HTML("""
-            <div style='background-color: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 15px;'>
-                <h3 style='margin-top: 0;'>Timeline Query</h3>
-                <p style='margin-bottom: 0;'>
-                    Select a desk and date to query timeline data.
-                </p>
-            </div>
-        """)
+        return widgets.HTML(_INSTRUCTIONS_HTML)
 
     def _on_submit(self, button):
         """
         Handle submit button click.
 
-        This method is called when user clicks the submit button.
-        It executes the tool and displays results.
+        This method is called when user clicks the submit button. The
+        tool runs on a worker thread so the kernel keeps handling widget
+        messages meanwhile; results are shown when the query finishes.
+        The loading indicator only appears if the query is still running
+        after LOADING_DELAY_SECONDS, so fast queries go straight from the
+        previous display to their result.
+        The submit button is disabled until the query finishes. Clicks
+        already on their way from the frontend when it was disabled are
+        ignored here too, so each query runs to completion and is shown.
 
         Args:
             button: Button widget (automatically passed by ipywidgets)
-        """
-        # Clear previous output
-        self.output_area.clear_output()
 
-        # Show loading indicator
-        with self.output_area:
-            display(widgets.HTML("""
-                <div style='text-align: center; padding: 20px;'>
-                    <div style='font-size: 24px;'>⏳</div>
-                    <div>Loading timeline data...</div>
-                </div>
-            """))
+        Returns:
+            concurrent.futures.Future: The background tool execution, or
+            None if the click was ignored
+        """
+        if self.submit_button.disabled:
+            return None
 
         # Get form values
         desk = self.desk_dropdown.value
@@ -157,44 +184,101 @@ class TimelineUI:
 
         # Execute the tool
         # This calls backend through executor
-        result = self.executor.execute(
-            user='dashboard_user',  # In production, get from auth
-            tool_path=self.tool_path,
-            params={
-                'desk': desk,
-                'date': date_str
-            }
+        return self._queries.run(
+            lambda: self.executor.execute(
+                user='dashboard_user',  # In production, get from auth
+                tool_path=self.tool_path,
+                params={
+                    'desk': desk,
+                    'date': date_str
+                }
+            ),
+            on_done=self._finish_query,
+            on_loading=self._show_loading,
+            on_start=lambda: self._set_querying(True),
+            on_error=self._fail_query
         )
 
-        # Clear loading indicator
-        self.output_area.clear_output()
+    def _set_querying(self, querying):
+        """
+        Disable the submit button while a query runs, and re-enable it.
 
-        # Display result
-        with self.output_area:
+        Args:
+            querying: True when a query starts, False when it is displayed
+        """
+        # One state message for both traits
+        with self.submit_button.hold_sync():
+            self.submit_button.disabled = querying
+            self.submit_button.description = 'Querying...' if querying else 'Query Timeline'
+
+    def _show_loading(self):
+        """Show the loading indicator while a slow query runs."""
+        self._status_html.value = _LOADING_HTML
+        self._show_results_table(False)
+
+    def _finish_query(self, result):
+        """
+        Display the latest query's result.
+
+        Results are shown by assigning widget traits, which is safe from
+        the worker thread this callback runs on.
+
+        Args:
+            result: Result object from executor.execute
+        """
+        try:
+            # Replace loading indicator (if shown) with the result
             if result.success:
                 self._display_success(result.data)
             else:
                 self._display_error(result)
+        finally:
+            self._set_querying(False)
+
+    def _fail_query(self, error):
+        """
+        Display a query that raised instead of returning a Result.
+
+        Args:
+            error: Exception raised by executor.execute
+        """
+        try:
+            self._status_html.value = error_display.error_html(
+                title="Unexpected Error",
+                message="The query could not be completed.",
+                details=str(error)
+            )
+            self._show_results_table(False)
+        finally:
+            self._set_querying(False)
 
     def _display_success(self, data):
         """
         Display successful results.
 
         Args:
-            data: Result data (dictionary with 'records' key)
+            data: Result data (dictionary with 'dataframe' key)
         """
-        # Extract records from result
-        records = data.get('records', data)
+        df = data['dataframe']
+
+        # Nothing to tabulate; the results table is left untouched
+        if df.empty:
+            self._status_html.value = _EMPTY_HTML
+            self._show_results_table(False)
+            return
 
-        # Show success message
-        display(self.error_display.create_success_widget(
-            f"Found {len(records)} timeline records"
-        ))
+        # Success message
+        self._status_html.value = error_display.success_html(
+            f"Found {len(df)} timeline records"
+        )
 
-        # Convert data to DataFrame and display with reusable component
-        df = pd.DataFrame(records)
-        table_widget = create_dataframe_table(df, title="Timeline Results")
-        display(table_widget)
+        # Display with reusable component, refilled on later queries
+        if self._results_table is None:
+            self._results_table = DataFrameTable(df, title="Timeline Results")
+            self.output_area.children = (self._status_html, self._results_table.widget)
+        else:
+            self._results_table.set_data(df)
+        self._show_results_table(True)
 
     def _display_error(self, result):
         """
@@ -203,8 +287,19 @@ class TimelineUI:
         Args:
             result: Result object with error info
         """
-        display(self.error_display.create_error_widget(
+        self._status_html.value = error_display.error_html(
             title=result.error_type or "Error",
             message=result.user_message or result.error_message,
             details=result.traceback
-        ))
+        )
+        self._show_results_table(False)
+
+    def _show_results_table(self, visible):
+        """
+        Show or hide the results table, if it has been built.
+
+        Args:
+            visible: True to show the table below the status message
+        """
+        if self._results_table is not None:
+            self._results_table.widget.layout.display = None if visible else 'none'